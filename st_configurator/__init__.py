@@ -1,4 +1,8 @@
 from st_configurator.layout_renderer import PageRenderer
-from st_configurator.layout_schema import ComponentConfig, PageConfig
+from st_configurator.layout_schema import (
+    ComponentConfig,
+    PageConfig,
+    SwitchConfig,
+)
 
-__all__ = ["PageRenderer", "ComponentConfig", "PageConfig"]
+__all__ = ["PageRenderer", "ComponentConfig", "PageConfig", "SwitchConfig"]
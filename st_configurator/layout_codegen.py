@@ -0,0 +1,613 @@
+from __future__ import annotations
+
+import contextlib
+import itertools
+import keyword
+import linecache
+import types
+import weakref
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import streamlit as st
+
+from st_configurator.layout_plan import (
+    IdentityCache,
+    KeyMode,
+    Node,
+    PagePlan,
+    RenderNode,
+    SwitchNode,
+    produce_children,
+)
+from st_configurator.placeholder import (
+    Condition,
+    Placeholder,
+    PlaceholderValue,
+)
+from st_configurator.placeholder.context import mark_stateless
+
+if TYPE_CHECKING:
+    from st_configurator.layout_renderer import PageRenderer
+
+_INDENT = "    "
+# Children are moved into a helper function before the generated code gets
+# close to the compiler's limits on indentation and nested 'with' blocks.
+_MAX_INDENT = 60
+_MAX_BLOCKS = 16
+# Generating and verifying code recurses once per level of nesting; deeper
+# plans are interpreted instead.
+_MAX_DEPTH = 100
+
+_GENERATED_CACHE: IdentityCache["GeneratedRender"] = IdentityCache()
+
+
+@dataclass(frozen=True, eq=False)
+class GeneratedRender:
+    """
+    A PagePlan compiled to straight-line Python.
+
+    Attributes:
+        source (str): The generated module source.
+        namespace (dict): The globals the source was executed in; holds the
+            components, constant arguments and placeholders it references.
+        function (Callable): The entry point, called with the PageRenderer.
+        function_names (Tuple[str, ...]): Every function defined by 'source'.
+        tables (dict): Switch dispatch tables, as (case value, function name)
+            pairs; bound into 'namespace' as dicts of functions.
+        defaults (dict): Names bound to the default branch of a switch.
+    """
+
+    source: str
+    namespace: Dict[str, Any]
+    function: Callable[["PageRenderer"], None]
+    function_names: Tuple[str, ...]
+    tables: Dict[str, Tuple[Tuple[Any, Optional[str]], ...]]
+    defaults: Dict[str, str]
+
+    def __call__(self, renderer: "PageRenderer") -> None:
+        self.function(renderer)
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.source)
+
+    def rebind(self, namespace: Dict[str, Any]) -> Callable:
+        """
+        Returns the entry point bound to a different set of globals.
+        """
+        namespace = dict(namespace)
+        for name in self.function_names:
+            code = self.namespace[name].__code__
+            namespace[name] = types.FunctionType(code, namespace, name)
+        _bind_tables(namespace, self.tables, self.defaults)
+        return namespace[self.function.__name__]
+
+
+def _bind_tables(
+    namespace: Dict[str, Any],
+    tables: Dict[str, Tuple[Tuple[Any, Optional[str]], ...]],
+    defaults: Dict[str, str],
+) -> None:
+    for table, cases in tables.items():
+        namespace[table] = {
+            value: None if name is None else namespace[name]
+            for value, name in cases
+        }
+    for default, name in defaults.items():
+        namespace[default] = namespace[name]
+
+
+class _SourceBuilder:
+    def __init__(self):
+        self.namespace: Dict[str, Any] = {"_st": st}
+        self.functions: List[List[str]] = []
+        self.function_names: List[str] = []
+        self.tables: Dict[str, Tuple[Tuple[Any, Optional[str]], ...]] = {}
+        self.defaults: Dict[str, str] = {}
+        self._counter = itertools.count()
+
+    def bind(self, prefix: str, value: Any) -> str:
+        name = f"{prefix}{next(self._counter)}"
+        self.namespace[name] = value
+        return name
+
+    def temp(self, prefix: str) -> str:
+        return f"{prefix}{next(self._counter)}"
+
+    def function(self, name: str, body: List[str]) -> str:
+        self.functions.append(
+            [f"def {name}(_r):"] + (body or [_INDENT + "pass"])
+        )
+        self.function_names.append(name)
+        return name
+
+    def nodes(
+        self,
+        nodes: Sequence[Optional[Node]],
+        out: List[str],
+        indent: int,
+        blocks: int,
+    ) -> None:
+        for node in nodes:
+            if node is not None:
+                self.node(node, out, indent, blocks)
+
+    def operand(self, operand: Any, out: List[str], indent: int) -> str:
+        """
+        Returns an expression evaluating a condition or switch selector,
+        emitting any statements it needs first.
+        """
+        if isinstance(operand, PlaceholderValue):
+            return f"{self.bind('q', operand)}.get()"
+        if isinstance(operand, Condition):
+            return f"{self.bind('q', operand)}.evaluate()"
+        if operand.memoize:
+            return f"_r._evaluate({self.bind('n', operand)})"
+        target = self.temp("t")
+        self.leaf(operand, out, indent, target=target)
+        return target
+
+    def node(
+        self, node: Node, out: List[str], indent: int, blocks: int
+    ) -> None:
+        if node.condition is not None:
+            condition = self.operand(node.condition, out, indent)
+            out.append(f"{_INDENT * indent}if {condition}:")
+            indent += 1
+
+        if isinstance(node, SwitchNode):
+            self.switch(node, out, indent)
+        elif node.container:
+            self.container(node, out, indent, blocks)
+        else:
+            self.leaf(node, out, indent)
+
+    def branch(self, node: Optional[Node]) -> Optional[str]:
+        if node is None:
+            return None
+        body: List[str] = []
+        self.node(node, body, 1, 0)
+        return self.function(self.temp("_case"), body)
+
+    def switch(self, node: SwitchNode, out: List[str], indent: int) -> None:
+        pad = _INDENT * indent
+        selector = self.operand(node.selector, out, indent)
+        table = self.temp("tbl")
+        # Tables are built once the case functions exist; see generate_page.
+        self.tables[table] = tuple(
+            (value, self.branch(case)) for value, case in node.cases.items()
+        )
+        default = self.bind("v", None)
+        default_branch = self.branch(node.default)
+        if default_branch is not None:
+            self.defaults[default] = default_branch
+        branch = self.temp("f")
+        cases = ", ".join(
+            f"{value!r}: {name}" for value, name in self.tables[table]
+        )
+        # Escaped, as a custom __repr__ may contain line breaks.
+        cases = cases.encode("unicode_escape").decode("ascii")
+        out.append(f"{pad}# {table} = {{{cases}}}")
+        out.append(f"{pad}try:")
+        out.append(
+            f"{pad}{_INDENT}{branch} = {table}.get({selector}, {default})"
+        )
+        out.append(f"{pad}except TypeError:")
+        out.append(f"{pad}{_INDENT}{branch} = {default}")
+        out.append(f"{pad}if {branch} is not None:")
+        out.append(f"{pad}{_INDENT}{branch}(_r)")
+
+    def _arguments(self, node: RenderNode) -> Tuple[List[str], List[str]]:
+        args = [
+            (
+                f"{self.bind('p', arg)}.get()"
+                if i in node.arg_slots
+                else self.bind("v", arg)
+            )
+            for i, arg in enumerate(node.args)
+        ]
+        kwargs, extra = [], []
+        for name, value in node.kwargs.items():
+            expr = (
+                f"{self.bind('p', value)}.get()"
+                if name in node.kwarg_slots
+                else self.bind("v", value)
+            )
+            if name.isidentifier() and not keyword.iskeyword(name):
+                kwargs.append(f"{name}={expr}")
+            else:
+                extra.append(f"{name!r}: {expr}")
+        if extra:
+            kwargs.append(f"**{{{', '.join(extra)}}}")
+        return args, kwargs
+
+    def leaf(
+        self,
+        node: RenderNode,
+        out: List[str],
+        indent: int,
+        target: Optional[str] = None,
+    ) -> None:
+        pad = _INDENT * indent
+        component = self.bind("c", node.component)
+        args, kwargs = self._arguments(node)
+        result_key = (
+            self.bind("r", node.result_key)
+            if node.result_key is not None
+            else None
+        )
+
+        if node.key_mode is KeyMode.OVERRIDE:
+            # Arguments are resolved before the override takes effect, as
+            # the override changes what the result key itself resolves to.
+            args_name, kwargs_name = self.temp("a"), self.temp("k")
+            out.append(
+                f"{pad}{args_name} = ({''.join(a + ', ' for a in args)})"
+            )
+            out.append(f"{pad}{kwargs_name} = dict({', '.join(kwargs)})")
+            out.append(
+                f"{pad}{result_key}.set_streamlit_key({kwargs_name}['key'])"
+            )
+            if node.stateless:
+                out.append(
+                    f"{pad}{self.bind('s', mark_stateless)}"
+                    f"({kwargs_name}['key'])"
+                )
+            call = f"{component}(*{args_name}, **{kwargs_name})"
+        else:
+            if node.key_mode is KeyMode.INJECT:
+                key = f"{result_key}.get_key()"
+                if node.stateless:
+                    key = self.temp("w")
+                    out.append(f"{pad}{key} = {result_key}.get_key()")
+                    out.append(f"{pad}{self.bind('s', mark_stateless)}({key})")
+                kwargs.append(f"key={key}")
+            call = f"{component}({', '.join(args + kwargs)})"
+
+        if result_key is None:
+            out.append(f"{pad}{target} = {call}" if target else pad + call)
+            return
+        target = target or self.temp("x")
+        out.append(f"{pad}{target} = {call}")
+        out.append(f"{pad}{result_key}.set({target})")
+
+    def container(
+        self, node: RenderNode, out: List[str], indent: int, blocks: int
+    ) -> None:
+        pad = _INDENT * indent
+        component = self.bind("c", node.component)
+        obj = self.temp("o")
+        call_args = []
+        if node.args:
+            call_args.append(f"*{self.bind('v', node.args)}")
+        if node.kwargs:
+            call_args.append(f"**{self.bind('v', node.kwargs)}")
+        out.append(f"{pad}{obj} = {component}({', '.join(call_args)})")
+        out.append(f"{pad}if {obj}:")
+
+        if node.factory is not None:
+            # Produced children are only known at render time.
+            out.append(
+                f"{pad}{_INDENT}_r._handle_children({obj}, "
+                f"{self.bind('n', node)})"
+            )
+            return
+
+        if node.nested:
+            test = (
+                f"isinstance({obj}, (list, tuple)) "
+                f"and len({obj}) == {len(node.children)}"
+            )
+            bodies = [
+                (f"{obj}[{i}]", column)
+                for i, column in enumerate(node.children)
+            ]
+        else:
+            test = (
+                f"not isinstance({obj}, (list, tuple)) "
+                f"and hasattr({obj}, '__enter__') "
+                f"and hasattr({obj}, '__exit__')"
+            )
+            bodies = [(obj, node.children)]
+
+        out.append(f"{pad}{_INDENT}if {test}:")
+        for cm, children in bodies:
+            out.append(f"{pad}{_INDENT * 2}with {cm}:")
+            self.body(children, out, indent + 3, blocks + 1)
+        out.append(f"{pad}{_INDENT}else:")
+        out.append(
+            f"{pad}{_INDENT * 2}_r._handle_children({obj}, "
+            f"{self.bind('n', node)})"
+        )
+
+    def body(
+        self,
+        nodes: Sequence[Optional[Node]],
+        out: List[str],
+        indent: int,
+        blocks: int,
+    ) -> None:
+        if indent > _MAX_INDENT or blocks > _MAX_BLOCKS:
+            helper: List[str] = []
+            self.nodes(nodes, helper, 1, 0)
+            name = self.function(self.temp("_body"), helper)
+            out.append(f"{_INDENT * indent}{name}(_r)")
+            return
+        start = len(out)
+        self.nodes(nodes, out, indent, blocks)
+        if len(out) == start:
+            out.append(f"{_INDENT * indent}pass")
+
+
+def can_generate(plan: PagePlan) -> bool:
+    """
+    Returns whether a plan is shallow enough to generate code for.
+    """
+    return plan.depth <= _MAX_DEPTH
+
+
+def _forget_source(filename: str, entry: Tuple) -> None:
+    # The filename holds the plan's id, which a later plan may reuse.
+    if linecache.cache.get(filename) is entry:
+        del linecache.cache[filename]
+
+
+def generate_page(plan: PagePlan) -> GeneratedRender:
+    """
+    Generates and compiles the straight-line render function of a plan.
+
+    Results are cached by plan identity, i.e. per PageConfig. Raises
+    ValueError for a plan nested too deeply, see can_generate.
+    """
+    generated = _GENERATED_CACHE.get(plan)
+    if generated is not None:
+        return generated
+    if not can_generate(plan):
+        raise ValueError(
+            f"Page {plan.page_tag!r} is nested {plan.depth} levels deep; "
+            f"code is only generated for up to {_MAX_DEPTH} levels."
+        )
+
+    builder = _SourceBuilder()
+    body: List[str] = []
+    if plan.sidebar:
+        body.append(f"{_INDENT}with _st.sidebar:")
+        builder.body(plan.sidebar, body, 2, 1)
+    builder.nodes(plan.body, body, 1, 0)
+    builder.function("render_page", body)
+
+    source = "\n\n\n".join("\n".join(lines) for lines in builder.functions)
+    source = f"# Generated from page {plan.page_tag!r}\n\n\n{source}\n"
+    filename = f"<st_configurator page {plan.page_tag!r} at {id(plan):#x}>"
+    # Registering the source lets tracebacks and debuggers show it.
+    entry = (len(source), None, source.splitlines(True), filename)
+    linecache.cache[filename] = entry
+    exec(compile(source, filename, "exec"), builder.namespace)
+    _bind_tables(builder.namespace, builder.tables, builder.defaults)
+
+    generated = GeneratedRender(
+        source=source,
+        namespace=builder.namespace,
+        function=builder.namespace["render_page"],
+        function_names=tuple(builder.function_names),
+        tables=builder.tables,
+        defaults=builder.defaults,
+    )
+    weakref.finalize(generated, _forget_source, filename, entry)
+    return _GENERATED_CACHE.set(plan, generated)
+
+
+class _Recorder:
+    def __init__(self, component: Callable, log: List[Tuple]):
+        self.component = component
+        self.log = log
+
+    def __call__(self, *args, **kwargs):
+        result = self.component(*args, **kwargs)
+        self.log.append((self.component, args, kwargs, result))
+        return result
+
+
+def _identity_decorator(fn: Callable) -> Callable:
+    return fn
+
+
+def _is_context_manager(obj) -> bool:
+    return hasattr(obj, "__enter__") and hasattr(obj, "__exit__")
+
+
+def _inert(result: Any, container: bool) -> Any:
+    """
+    Makes a recorded result safe to hand to the interpreter a second time:
+    containers are not re-entered and decorators are not re-applied.
+    """
+    if _is_context_manager(result):
+        return contextlib.nullcontext()
+    if isinstance(result, (list, tuple)):
+        return type(result)(
+            contextlib.nullcontext() if _is_context_manager(item) else item
+            for item in result
+        )
+    if container and callable(result):
+        return _identity_decorator
+    return result
+
+
+def _same(left: Any, right: Any) -> bool:
+    if left is right:
+        return True
+    try:
+        return bool(left == right)
+    except Exception:
+        return False
+
+
+def _same_call(args, kwargs, expected_args, expected_kwargs) -> bool:
+    return (
+        len(args) == len(expected_args)
+        and all(map(_same, args, expected_args))
+        and kwargs.keys() == expected_kwargs.keys()
+        and all(_same(kwargs[k], expected_kwargs[k]) for k in kwargs)
+    )
+
+
+class _Replayer:
+    def __init__(
+        self,
+        component: Callable,
+        log: List[Tuple],
+        cursor: List[int],
+        container: bool,
+    ):
+        self.component = component
+        self.log = log
+        self.cursor = cursor
+        self.container = container
+
+    def __call__(self, *args, **kwargs):
+        index = self.cursor[0]
+        if index >= len(self.log):
+            raise RuntimeError(
+                f"Generated code diverged from the interpreter: the "
+                f"interpreter made an extra call #{index} to "
+                f"{self.component!r}."
+            )
+        component, expected_args, expected_kwargs, result = self.log[index]
+        if component is not self.component or not _same_call(
+            args, kwargs, expected_args, expected_kwargs
+        ):
+            raise RuntimeError(
+                f"Generated code diverged from the interpreter at call "
+                f"#{index}: generated {component!r}{expected_args!r} "
+                f"{expected_kwargs!r}, interpreted "
+                f"{self.component!r}{tuple(args)!r} {kwargs!r}."
+            )
+        self.cursor[0] += 1
+        return _inert(result, self.container)
+
+
+def _shadow_nodes(
+    nodes: Sequence[Optional[Node]],
+    wrap: Callable[[RenderNode], Callable],
+    memo: Dict[int, Node],
+) -> Tuple[Optional[Node], ...]:
+    return tuple(
+        None if node is None else _shadow(node, wrap, memo) for node in nodes
+    )
+
+
+def _shadow(
+    node: Node,
+    wrap: Callable[[RenderNode], Callable],
+    memo: Dict[int, Node],
+) -> Node:
+    """
+    Copies a node tree, replacing every component with wrap(node).
+    """
+    shadow = memo.get(id(node))
+    if shadow is not None:
+        return shadow
+    condition = node.condition
+    if isinstance(condition, RenderNode):
+        condition = _shadow(condition, wrap, memo)
+    if isinstance(node, SwitchNode):
+        selector = node.selector
+        if isinstance(selector, RenderNode):
+            selector = _shadow(selector, wrap, memo)
+        shadow = replace(
+            node,
+            selector=selector,
+            cases={
+                value: _shadow_nodes((case,), wrap, memo)[0]
+                for value, case in node.cases.items()
+            },
+            default=_shadow_nodes((node.default,), wrap, memo)[0],
+            condition=condition,
+        )
+        memo[id(node)] = shadow
+        return shadow
+    if node.nested:
+        children = tuple(
+            _shadow_nodes(column, wrap, memo) for column in node.children
+        )
+    else:
+        children = _shadow_nodes(node.children, wrap, memo)
+    factory = node.factory
+    if factory is not None:
+
+        def factory():
+            # Produced nodes may not outlive the call, so their ids are
+            # not stable enough for the shared memo.
+            return _shadow_nodes(
+                tuple(produce_children(node.factory)), wrap, {}
+            )
+
+    shadow = replace(
+        node,
+        component=wrap(node),
+        condition=condition,
+        children=children,
+        factory=factory,
+    )
+    memo[id(node)] = shadow
+    return shadow
+
+
+def render_and_compare(
+    renderer: "PageRenderer", plan: PagePlan, generated: GeneratedRender
+) -> None:
+    """
+    Renders with the generated code and checks it against the interpreter.
+
+    The generated render runs for real while recording every component call.
+    The interpreter then walks the same plan against that recording, with
+    placeholder state rewound to where the generated render started, and a
+    RuntimeError is raised at the first call that differs. Cond expressions
+    are not recorded; both renders evaluate them.
+    """
+    log: List[Tuple] = []
+    recorders: Dict[int, Callable] = {}
+
+    def _record(node: RenderNode) -> Callable:
+        return _Recorder(node.component, log)
+
+    namespace = dict(generated.namespace)
+    memo: Dict[int, RenderNode] = {}
+    for name, value in generated.namespace.items():
+        if isinstance(value, RenderNode):
+            namespace[name] = _shadow(value, _record, memo)
+        elif name.startswith("c") and name[1:].isdigit():
+            recorders.setdefault(id(value), _Recorder(value, log))
+            namespace[name] = recorders[id(value)]
+
+    state = Placeholder._export_state()
+    generated.rebind(namespace)(renderer)
+    rendered_state = Placeholder._export_state()
+
+    cursor = [0]
+    memo = {}
+
+    def _replay(node: RenderNode) -> Callable:
+        return _Replayer(node.component, log, cursor, node.container)
+
+    Placeholder._import_state(state)
+    try:
+        renderer._render_nodes(_shadow_nodes(plan.sidebar, _replay, memo))
+        renderer._render_nodes(_shadow_nodes(plan.body, _replay, memo))
+    finally:
+        Placeholder._import_state(rendered_state)
+    if cursor[0] != len(log):
+        raise RuntimeError(
+            f"Generated code diverged from the interpreter: generated "
+            f"{len(log)} calls, interpreted {cursor[0]}."
+        )
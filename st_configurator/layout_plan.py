@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from st_configurator.layout_schema import (
+    ComponentConfig,
+    PageConfig,
+    SwitchConfig,
+)
+from st_configurator.placeholder import (
+    Condition,
+    Lazy,
+    PlaceholderValue,
+    get_capabilities,
+)
+
+T = TypeVar("T")
+
+
+class KeyMode(Enum):
+    NONE = 0
+    INJECT = 1
+    OVERRIDE = 2
+
+
+@dataclass(frozen=True, eq=False)
+class RenderNode:
+    """
+    The compiled form of a single ComponentConfig.
+
+    Every decision the renderer used to make on each rerun is taken once
+    here: whether the config is a container, where its PlaceholderValues and
+    Lazy arguments sit in 'args'/'kwargs', how the 'key' argument is handled and, for nested
+    rows, the children already transposed into one sequence per container.
+    Children produced by a factory are compiled as they are rendered.
+    """
+
+    component: Callable
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    arg_slots: Tuple[int, ...]
+    kwarg_slots: Tuple[str, ...]
+    key_mode: KeyMode
+    result_key: Optional[PlaceholderValue]
+    condition: Union[PlaceholderValue, Condition, "RenderNode", None]
+    memoize: bool
+    container: bool
+    nested: bool
+    children: Tuple[Any, ...]
+    factory: Union[Callable[[], Any], Lazy, None] = None
+    # The keyed widget refuses st.session_state writes (e.g. a button).
+    stateless: bool = False
+
+
+@dataclass(frozen=True, eq=False)
+class SwitchNode:
+    """
+    The compiled form of a SwitchConfig: the selector is evaluated once and
+    the branch to render found with a single dict lookup.
+    """
+
+    selector: Union[PlaceholderValue, Condition, RenderNode]
+    cases: Dict[Any, Optional[RenderNode]]
+    default: Optional[RenderNode]
+    condition: Union[PlaceholderValue, Condition, RenderNode, None]
+
+
+Node = Union[RenderNode, SwitchNode]
+
+
+@dataclass(frozen=True, eq=False)
+class PagePlan:
+    page_tag: str
+    body: Tuple[Optional[Node], ...]
+    sidebar: Tuple[Optional[Node], ...]
+    # Keyed widgets refusing st.session_state writes, outside factories.
+    stateless: Tuple[RenderNode, ...] = ()
+    # The deepest nesting of nodes, conditions and switch branches.
+    depth: int = 0
+
+
+class IdentityCache(Generic[T]):
+    """
+    A process-wide mapping from live objects to values derived from them.
+
+    Entries are keyed by object identity, so unhashable dataclasses can be
+    used as keys, and are dropped as soon as the object is garbage collected.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[weakref.ref, T]] = {}
+        # Refs of collected objects, removed under the lock by the next set.
+        # The weakref callback may run on any thread, including one holding
+        # the lock, so it only records the ref.
+        self._dead: List[Tuple[int, weakref.ref]] = []
+        self._lock = threading.Lock()
+
+    def get(self, obj) -> Optional[T]:
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return None
+
+    def set(self, obj, value: T) -> T:
+        key = id(obj)
+        dead = self._dead
+
+        def _discard(ref):
+            dead.append((key, ref))
+
+        with self._lock:
+            self._purge()
+            self._entries[key] = (weakref.ref(obj, _discard), value)
+        return value
+
+    def _purge(self) -> None:
+        entries = self._entries
+        while self._dead:
+            key, ref = self._dead.pop()
+            entry = entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del entries[key]
+
+    def discard(self, obj) -> None:
+        with self._lock:
+            self._entries.pop(id(obj), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_NODE_CACHE: IdentityCache[Node] = IdentityCache()
+_PLAN_CACHE: IdentityCache[PagePlan] = IdentityCache()
+
+
+def _key_mode(config: ComponentConfig) -> KeyMode:
+    if config.result_key is None:
+        return KeyMode.NONE
+    if not get_capabilities(config.component).has_key:
+        return KeyMode.NONE
+    if "key" in config.kwargs:
+        return KeyMode.OVERRIDE
+    return KeyMode.INJECT
+
+
+Config = Union[ComponentConfig, SwitchConfig]
+
+
+def _referenced_configs(config: Config) -> List[Config]:
+    referenced = []
+    if isinstance(config.condition, ComponentConfig):
+        referenced.append(config.condition)
+    if isinstance(config, SwitchConfig):
+        if isinstance(config.selector, ComponentConfig):
+            referenced.append(config.selector)
+        referenced.extend(
+            case for case in config.cases.values() if case is not None
+        )
+        if config.default is not None:
+            referenced.append(config.default)
+        return referenced
+    if _is_factory(config.children):
+        return referenced
+    for child in config.children or ():
+        if isinstance(child, (list, tuple)):
+            referenced.extend(item for item in child if item is not None)
+        elif child is not None:
+            referenced.append(child)
+    return referenced
+
+
+def _is_factory(children: Any) -> bool:
+    return isinstance(children, Lazy) or callable(children)
+
+
+def _compiled_layout(
+    configs: Sequence[Optional[Config]],
+) -> Tuple[Optional[Node], ...]:
+    return tuple(
+        None if config is None else _NODE_CACHE.get(config)
+        for config in configs
+    )
+
+
+def _compiled_children(children: Sequence) -> Tuple[bool, Tuple[Any, ...]]:
+    if children and isinstance(children[0], (list, tuple)):
+        columns = tuple(_compiled_layout(column) for column in zip(*children))
+        return True, columns
+    return False, _compiled_layout(children)
+
+
+def _compiled(config: Any) -> Any:
+    if isinstance(config, (ComponentConfig, SwitchConfig)):
+        return _NODE_CACHE.get(config)
+    return config
+
+
+def _compiled_condition(condition: Any) -> Any:
+    if isinstance(condition, bool):
+        # e.g. 'PH.MODE == "a"', which compares the placeholder itself.
+        raise TypeError(
+            "A condition cannot be a bool; compare placeholders with "
+            "Condition builders such as PH.MODE.eq(value)."
+        )
+    return _compiled(condition)
+
+
+def _build_switch(config: SwitchConfig) -> SwitchNode:
+    return SwitchNode(
+        selector=_compiled(config.selector),
+        cases={value: _compiled(case) for value, case in config.cases.items()},
+        default=_compiled(config.default),
+        condition=_compiled_condition(config.condition),
+    )
+
+
+def _build_node(config: Config) -> Node:
+    # Every config referenced by 'config' has already been compiled.
+    if isinstance(config, SwitchConfig):
+        return _build_switch(config)
+
+    condition = _compiled_condition(config.condition)
+
+    factory = config.children if _is_factory(config.children) else None
+    container = bool(config.children)
+    nested, children = (
+        _compiled_children(config.children)
+        if container and factory is None
+        else (False, ())
+    )
+    args = tuple(config.args)
+    kwargs = dict(config.kwargs)
+    key_mode = KeyMode.NONE if container else _key_mode(config)
+    return RenderNode(
+        component=config.component,
+        args=args,
+        kwargs=kwargs,
+        arg_slots=tuple(
+            i
+            for i, arg in enumerate(args)
+            if isinstance(arg, (PlaceholderValue, Lazy))
+        ),
+        kwarg_slots=tuple(
+            name
+            for name, value in kwargs.items()
+            if isinstance(value, (PlaceholderValue, Lazy))
+        ),
+        key_mode=key_mode,
+        result_key=config.result_key,
+        condition=condition,
+        memoize=config.memoize,
+        container=container,
+        nested=nested,
+        children=children,
+        factory=factory,
+        stateless=key_mode is not KeyMode.NONE
+        and not get_capabilities(config.component).accepts_state,
+    )
+
+
+def compile_config(config: Config) -> Node:
+    node = _NODE_CACHE.get(config)
+    if node is not None:
+        return node
+
+    # Post-order walk with an explicit stack, so arbitrarily deep layouts
+    # compile without recursion: a config is built once all the configs it
+    # references are.
+    stack = [config]
+    while stack:
+        current = stack[-1]
+        if _NODE_CACHE.get(current) is not None:
+            stack.pop()
+            continue
+        pending = [
+            referenced
+            for referenced in _referenced_configs(current)
+            if _NODE_CACHE.get(referenced) is None
+        ]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        _NODE_CACHE.set(current, _build_node(current))
+    return _NODE_CACHE.get(config)
+
+
+def produce_children(
+    factory: Union[Callable[[], Any], Lazy],
+) -> Iterator[Optional[Node]]:
+    """
+    Calls a children factory and compiles what it produces one child at a
+    time, as the children are rendered.
+    """
+    produced = factory.get() if isinstance(factory, Lazy) else factory()
+    for child in produced:
+        if child is None or isinstance(child, (RenderNode, SwitchNode)):
+            yield child
+        elif isinstance(child, (list, tuple)):
+            # Rows are transposed into one sequence per container, which
+            # needs every row up front.
+            raise TypeError(
+                "A children factory must produce configs one at a time, not "
+                "rows; pass rows as a static 'children' list instead."
+            )
+        else:
+            yield compile_config(child)
+
+
+def compile_layout(
+    configs: Sequence[Optional[Config]],
+) -> Tuple[Optional[Node], ...]:
+    return tuple(
+        None if config is None else compile_config(config)
+        for config in configs
+    )
+
+
+def _scan(nodes: Sequence[Any]) -> Tuple[List[RenderNode], int]:
+    """
+    Returns the stateless widgets of a layout, in render order, and its
+    deepest level of nesting.
+    """
+    # Pre-order walk with an explicit stack, as in compile_config, so deep
+    # layouts are scanned without recursion.
+    stateless = []
+    depth = 0
+    stack = [(node, 1) for node in reversed(nodes)]
+    while stack:
+        node, level = stack.pop()
+        if isinstance(node, SwitchNode):
+            referenced = (
+                node.selector,
+                node.default,
+                node.condition,
+                *node.cases.values(),
+            )
+        elif isinstance(node, RenderNode):
+            if node.stateless:
+                stateless.append(node)
+            referenced = (node.condition, *node.children)
+        elif isinstance(node, tuple):
+            # The columns of nested rows, at the level of their container.
+            stack.extend((item, level) for item in reversed(node))
+            continue
+        else:
+            continue
+        depth = max(depth, level)
+        stack.extend((item, level + 1) for item in reversed(referenced))
+    return stateless, depth
+
+
+def compile_page(configs: PageConfig) -> PagePlan:
+    plan = _PLAN_CACHE.get(configs)
+    if plan is not None:
+        return plan
+    body = compile_layout(configs.body)
+    sidebar = compile_layout(configs.sidebar)
+    stateless, depth = _scan(sidebar + body)
+    plan = PagePlan(
+        page_tag=configs.page_tag,
+        body=body,
+        sidebar=sidebar,
+        stateless=tuple(dict.fromkeys(stateless)),
+        depth=depth,
+    )
+    return _PLAN_CACHE.set(configs, plan)
+
+
+def clear_plan_cache() -> None:
+    """
+    Drops every compiled plan.
+
+    Plans assume configs are not mutated in place after their first render;
+    call this after doing so (ComponentConfig.update returns a new config and
+    needs no invalidation).
+    """
+    _NODE_CACHE.clear()
+    _PLAN_CACHE.clear()
@@ -1,108 +1,134 @@
 from typing import (
     Any,
-    Callable,
     ContextManager,
-    Iterable,
-    Mapping,
+    Iterator,
+    List,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
 import streamlit as st
 
-from st_configurator.layout_schema import ComponentConfig, PageConfig
-from st_configurator.placeholder import Placeholder, PlaceholderValue
+from st_configurator.layout_codegen import (
+    GeneratedRender,
+    can_generate,
+    generate_page,
+    render_and_compare,
+)
+from st_configurator.layout_plan import (
+    KeyMode,
+    Node,
+    PagePlan,
+    RenderNode,
+    SwitchNode,
+    compile_layout,
+    compile_page,
+    produce_children,
+)
+from st_configurator.layout_schema import (
+    ComponentConfig,
+    PageConfig,
+    SwitchConfig,
+)
+from st_configurator.placeholder import (
+    Condition,
+    Placeholder,
+    PlaceholderValue,
+)
+from st_configurator.placeholder.cold import switch_page
+from st_configurator.placeholder.context import (
+    lookup_memo,
+    mark_stateless,
+    render_pass,
+    store_memo,
+    tracked_reads,
+)
+from st_configurator.placeholder.durable import load_persisted
+from st_configurator.placeholder.eviction import enforce_budget
+from st_configurator.placeholder.query import decode_query, encode_query
+from st_configurator.placeholder.remote import pull_state, push_state
+
+_Frame = Tuple[Iterator, Optional[ContextManager]]
+_DONE = object()
 
 
 class PageRenderer:
+    def __init__(self, codegen: bool = False, verify_codegen: bool = False):
+        """Initialize the renderer.
+        Args:
+            codegen (bool): Render pages through generated Python code instead of interpreting their plan; pages nested too deeply are still interpreted. Defaults to False.
+            verify_codegen (bool): Check every generated render against the interpreter and raise RuntimeError on the first differing component call. Implies codegen. Defaults to False.
+        """
+        self.codegen = codegen or verify_codegen
+        self.verify_codegen = verify_codegen
 
-    def _placeholder_wrapper(
-        self,
-        component: Callable,
-        args: Iterable,
-        kwargs: Mapping,
-        result_key: Optional[PlaceholderValue] = None,
-    ):
-        args, kwargs = Placeholder.update_param_placeholders(
-            component, args, kwargs, result_key
-        )
-        result = component(*args, **kwargs)
-        if result_key:
-            result_key.set(result)
-        return result
+    def _build_component(self, node: RenderNode):
+        args = node.args
+        if node.arg_slots:
+            args = list(args)
+            for i in node.arg_slots:
+                args[i] = args[i].get()
+
+        kwargs = node.kwargs
+        if node.kwarg_slots or node.key_mode is not KeyMode.NONE:
+            kwargs = dict(kwargs)
+            for name in node.kwarg_slots:
+                kwargs[name] = kwargs[name].get()
+            if node.key_mode is KeyMode.INJECT:
+                kwargs["key"] = node.result_key.get_key()
+            elif node.key_mode is KeyMode.OVERRIDE:
+                node.result_key.set_streamlit_key(kwargs["key"])
+            if node.stateless:
+                mark_stateless(kwargs["key"])
 
-    def _build_component(
-        self,
-        config: ComponentConfig,
-    ):
-        component = config.component
-        args = config.args
-        kwargs = config.kwargs
-        result_key = config.result_key
-        result = self._placeholder_wrapper(component, args, kwargs, result_key)
+        result = node.component(*args, **kwargs)
+        if node.result_key is not None:
+            node.result_key.set(result)
         return result
 
     def __is_context_manager(self, obj) -> bool:
         return hasattr(obj, "__enter__") and hasattr(obj, "__exit__")
 
-    def _handle_context_manager(
-        self, obj: ContextManager, children: Sequence[ComponentConfig | None]
-    ) -> None:
-        with obj:
-            self.render_layout(children)
-
-    def _handle_decorator(
-        self, obj: Callable[..., Callable], children: Sequence[ComponentConfig]
-    ) -> None:
-        decorated_render = obj(self.render_layout)
-        decorated_render(children)
-
-    def _handle_single_children(
-        self, obj: ContextManager, children: Sequence[ComponentConfig | None]
-    ) -> None:
-        self._handle_context_manager(obj, children)
+    def _children_frame(self, obj: Any, node: RenderNode) -> Optional[_Frame]:
+        """
+        Returns the stack frame that renders a container's children, or None
+        if a decorator container already rendered them.
 
-    def _handle_nested_children(
-        self,
-        obj: Sequence[ContextManager],
-        children: Sequence[Sequence[ComponentConfig | None]],
-    ) -> None:
-        transposed_children = list(map(list, zip(*children)))
-        for i, obj_item in enumerate(obj):
-            self._handle_context_manager(obj_item, transposed_children[i])
-
-    def _handle_children(
-        self,
-        obj: Any,
-        children: Sequence,
-    ) -> None:
-        if children and isinstance(children[0], (list, tuple)):
-            self._handle_nested_children(obj, children)
-        else:
+        Containers returning several context managers (columns, tabs) get a
+        frame yielding one (context manager, children) pair per item, each
+        entered only when the walk reaches it.
+        """
+        children = node.children
+        if node.factory is not None:
+            children = produce_children(node.factory)
             if isinstance(obj, (list, tuple)):
-                for i, obj_item in enumerate(obj):
-                    self._handle_context_manager(obj_item, [children[i]])
-            elif self.__is_context_manager(obj):
-                self._handle_single_children(obj, children)
-            else:
-                self._handle_decorator(obj, children)
-
-    def _children_parser(self, config: ComponentConfig):
-        component = config.component
-        args = config.args
-        kwargs = config.kwargs
-        children = config.children
-
-        obj = component(*args, **kwargs)
-
-        if not obj or not children:
-            return
+                children = tuple(children)
+        if node.nested:
+            return (
+                ((obj_item, children[i]) for i, obj_item in enumerate(obj)),
+                None,
+            )
+        if isinstance(obj, (list, tuple)):
+            return (
+                ((obj_item, (children[i],)) for i, obj_item in enumerate(obj)),
+                None,
+            )
+        if self.__is_context_manager(obj):
+            obj.__enter__()
+            return iter(children), obj
+        decorated_render = obj(self._render_nodes)
+        decorated_render(children)
+        return None
 
-        self._handle_children(obj, children)
+    def _handle_children(self, obj: Any, node: RenderNode) -> None:
+        frame = self._children_frame(obj, node)
+        if frame is not None:
+            self._walk([frame])
 
     def _check_condition(
-        self, condition: Union[PlaceholderValue, ComponentConfig, None]
+        self, condition: Union[PlaceholderValue, Condition, RenderNode, None]
     ) -> bool:
         if condition is None:
             return True
@@ -110,33 +136,169 @@ class PageRenderer:
         if isinstance(condition, PlaceholderValue):
             return bool(condition.get())
 
-        return self._build_component(condition)
+        if isinstance(condition, Condition):
+            return condition.evaluate()
 
-    def render_layout(self, configs: Sequence[ComponentConfig | None]) -> None:
-        for config in configs:
-            if config is None:
-                continue
+        return self._evaluate(condition)
 
-            # Check conditions early and continue if not met
-            if not self._check_condition(config.condition):
-                continue
+    def _evaluate(self, node: RenderNode):
+        if node.memoize:
+            return self._memoized_condition(node)
+        return self._build_component(node)
+
+    def _switch_branch(self, node: SwitchNode) -> Optional[Node]:
+        selector = node.selector
+        if isinstance(selector, PlaceholderValue):
+            value = selector.get()
+        elif isinstance(selector, Condition):
+            value = selector.evaluate()
+        else:
+            value = self._evaluate(selector)
+        try:
+            return node.cases.get(value, node.default)
+        except TypeError:
+            # Unhashable selector values cannot match any case.
+            return node.default
 
-            # Handle children configurations
-            if config.children:
-                self._children_parser(config)
+    def _memoized_condition(self, condition: RenderNode):
+        # Shared by every config the condition guards, and across reruns
+        # while the node is, until a placeholder read while evaluating it
+        # changes. Nodes are cached per config object, see compile_page.
+        hit, result = lookup_memo(condition)
+        if hit:
+            return result
+        with tracked_reads() as reads:
+            result = self._build_component(condition)
+        store_memo(condition, reads, result)
+        return result
+
+    def _unwind(self, stack: List[_Frame], exc: BaseException) -> None:
+        # Exits open context managers innermost first, as nested 'with'
+        # statements would, until one of them suppresses the exception.
+        while stack:
+            _, cm = stack.pop()
+            if cm is None:
                 continue
+            try:
+                if cm.__exit__(type(exc), exc, exc.__traceback__):
+                    return
+            except BaseException as exit_exc:
+                exc = exit_exc
+        raise exc
+
+    def _walk(self, stack: List[_Frame]) -> None:
+        """
+        Renders the layout iteratively with an explicit stack of frames.
+
+        Each frame pairs an iterator over nodes (or over (context manager,
+        children) pairs) with the context manager to exit once it is
+        exhausted, so nesting depth costs no Python recursion.
+        """
+        while stack:
+            items, cm = stack[-1]
+            try:
+                item = next(items, _DONE)
+                if item is _DONE:
+                    stack.pop()
+                    if cm is not None:
+                        cm.__exit__(None, None, None)
+                    continue
+
+                if item is None:
+                    continue
+
+                if type(item) is tuple:
+                    obj_item, children = item
+                    obj_item.__enter__()
+                    stack.append((iter(children), obj_item))
+                    continue
+
+                # Check conditions early and continue if not met
+                if not self._check_condition(item.condition):
+                    continue
+
+                if type(item) is SwitchNode:
+                    branch = self._switch_branch(item)
+                    if branch is not None:
+                        stack.append((iter((branch,)), None))
+                    continue
+
+                # Process regular streamlit elements
+                if not item.container:
+                    self._build_component(item)
+                    continue
 
-            # Process regular streamlit elements
-            self._build_component(config)
-        return
+                # Handle children configurations
+                obj = item.component(*item.args, **item.kwargs)
+                if not obj:
+                    continue
+                frame = self._children_frame(obj, item)
+                if frame is not None:
+                    stack.append(frame)
+            except BaseException as exc:
+                self._unwind(stack, exc)
+
+    def _render_nodes(self, nodes: Sequence[Optional[Node]]) -> None:
+        self._walk([(iter(nodes), None)])
+
+    def render_layout(
+        self, configs: Sequence[ComponentConfig | SwitchConfig | None]
+    ) -> None:
+        with render_pass():
+            self._render_nodes(compile_layout(configs))
+
+    def compile(self, configs: PageConfig) -> PagePlan:
+        """
+        Compiles a PageConfig into a render plan.
+
+        Plans are cached process-wide by config identity and shared by every
+        session, so the tree is only interpreted on its first render.
+        """
+        return compile_page(configs)
+
+    def generate(self, configs: PageConfig) -> GeneratedRender:
+        """
+        Generates the straight-line render function of a PageConfig.
+
+        The result is cached per config; its 'source' can be inspected or
+        written out with 'dump' for debugging.
+        """
+        return generate_page(self.compile(configs))
 
     def render_page(self, configs: PageConfig) -> None:
-        page_tag = configs.page_tag
-        sidebar_configs = configs.sidebar
-        body_configs = configs.body
-        Placeholder._CURRENT_PAGE.set(page_tag)
-        if sidebar_configs:
+        plan = self.compile(configs)
+        Placeholder._CURRENT_PAGE.set(plan.page_tag)
+        with render_pass():
+            switch_page(plan.page_tag)
+            self._mark_stateless(plan)
+            load_persisted(plan.page_tag)
+            pull_state(plan.page_tag)
+            decode_query()
+            self._render_plan(plan)
+            encode_query()
+            push_state(plan.page_tag)
+            enforce_budget(plan.page_tag)
+
+    def _mark_stateless(self, plan: PagePlan) -> None:
+        # Before anything writes widget state, so that a new session (e.g.
+        # one opened from a link) leaves these widgets' keys alone.
+        for node in plan.stateless:
+            if node.key_mode is KeyMode.INJECT:
+                mark_stateless(node.result_key.get_key())
+            elif "key" in node.kwarg_slots:
+                mark_stateless(node.kwargs["key"].get())
+            else:
+                mark_stateless(node.kwargs["key"])
+
+    def _render_plan(self, plan: PagePlan) -> None:
+        if self.codegen and can_generate(plan):
+            generated = generate_page(plan)
+            if self.verify_codegen:
+                render_and_compare(self, plan, generated)
+            else:
+                generated(self)
+            return
+        if plan.sidebar:
             with st.sidebar:
-                self.render_layout(sidebar_configs)
-        self.render_layout(body_configs)
-        return
+                self._render_nodes(plan.sidebar)
+        self._render_nodes(plan.body)
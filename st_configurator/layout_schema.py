@@ -6,7 +6,9 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -14,7 +16,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from st_configurator.placeholder import PlaceholderValue
+    from st_configurator.placeholder import Condition, Lazy, PlaceholderValue
 
 
 @dataclass
@@ -24,23 +26,40 @@ class ComponentConfig:
     kwargs: Dict[str, Union[PlaceholderValue, Any]] = field(
         default_factory=dict
     )
-    children: Optional[
+    # Either the children themselves, or a callable (e.g. a generator
+    # function) or Lazy producing them, called each time the container
+    # renders and consumed as the children are rendered.
+    children: Union[
         Sequence[
             Union[
-                "ComponentConfig", Sequence[Optional["ComponentConfig"]], None
+                "ComponentConfig",
+                "SwitchConfig",
+                Sequence[Optional[Union["ComponentConfig", "SwitchConfig"]]],
+                None,
             ]
-        ]
+        ],
+        Callable[[], Iterable[Optional["ComponentConfig"]]],
+        "Lazy",
+        None,
     ] = field(default_factory=list)
-    condition: Optional[Union[PlaceholderValue, "ComponentConfig"]] = None
+    condition: Optional[
+        Union[PlaceholderValue, Condition, "ComponentConfig"]
+    ] = None
     result_key: Optional[PlaceholderValue] = None
+    # When used as a condition: reuse the last result for as long as the
+    # placeholders it read are unchanged, instead of calling it again.
+    memoize: bool = False
 
     def update(
         self,
         args: Optional[Tuple[Union[PlaceholderValue, Any], ...]] = None,
         kwargs: Optional[Dict[str, Union[PlaceholderValue, Any]]] = None,
         children: Optional[List["ComponentConfig"]] = None,
-        condition: Optional[Union[PlaceholderValue, "ComponentConfig"]] = None,
+        condition: Optional[
+            Union[PlaceholderValue, Condition, "ComponentConfig"]
+        ] = None,
         result_key: Optional[PlaceholderValue] = None,
+        memoize: Optional[bool] = None,
     ) -> "ComponentConfig":
         """
         Returns a new ComponentConfig with updated fields.
@@ -52,6 +71,7 @@ class ComponentConfig:
         - children: If provided, replaces the current 'children' entirely.
         - condition: If provided, directly replaces the current 'condition'.
         - result_key: If provided, directly replaces the current 'result_key'.
+        - memoize: If provided, directly replaces the current 'memoize'.
 
         Any fields not specified will remain unchanged.
         """
@@ -68,11 +88,48 @@ class ComponentConfig:
             result_key=(
                 result_key if result_key is not None else self.result_key
             ),
+            memoize=memoize if memoize is not None else self.memoize,
+        )
+
+    @staticmethod
+    def switch(
+        selector: Union[PlaceholderValue, Condition, "ComponentConfig"],
+        cases: Mapping[Any, Optional["ComponentConfig"]],
+        default: Optional["ComponentConfig"] = None,
+        condition: Optional[
+            Union[PlaceholderValue, Condition, "ComponentConfig"]
+        ] = None,
+    ) -> "SwitchConfig":
+        """
+        Returns a SwitchConfig rendering the case matching 'selector'.
+
+        The selector is evaluated once per render and its value looked up in
+        'cases'; 'default' is rendered when no case matches.
+        """
+        return SwitchConfig(
+            selector=selector,
+            cases=cases,
+            default=default,
+            condition=condition,
         )
 
 
+@dataclass
+class SwitchConfig:
+    selector: Union[PlaceholderValue, Condition, ComponentConfig]
+    cases: Mapping[Any, Optional[ComponentConfig]] = field(
+        default_factory=dict
+    )
+    default: Optional[ComponentConfig] = None
+    condition: Optional[
+        Union[PlaceholderValue, Condition, ComponentConfig]
+    ] = None
+
+
 @dataclass
 class PageConfig:
     page_tag: str
-    body: List[ComponentConfig]
-    sidebar: List[ComponentConfig] = field(default_factory=list)
+    body: List[Union[ComponentConfig, SwitchConfig]]
+    sidebar: List[Union[ComponentConfig, SwitchConfig]] = field(
+        default_factory=list
+    )
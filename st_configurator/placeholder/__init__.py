@@ -1,3 +1,38 @@
-from .placeholder import PlaceholderValue, Placeholder
+from .capabilities import (
+    ComponentCapabilities,
+    get_capabilities,
+    register_capabilities,
+)
+from .cold import ColdStorage
+from .conditions import Cond, Condition
+from .derived import DerivedPlaceholder
+from .durable import PersistenceBackend, SQLiteBackend
+from .eviction import MemoryBudget
+from .lazy import Lazy
+from .placeholder import PlaceholderValue, Placeholder, HASH_FUNCS
+from .query import QueryField, QueryState
+from .remote import MemoryStore, PlaceholderStore, RedisStore
+from .snapshot import PlaceholderSnapshot
 
-__all__ = ["PlaceholderValue", "Placeholder"]
\ No newline at end of file
+__all__ = [
+    "PlaceholderValue",
+    "Placeholder",
+    "DerivedPlaceholder",
+    "MemoryBudget",
+    "ColdStorage",
+    "PersistenceBackend",
+    "SQLiteBackend",
+    "PlaceholderStore",
+    "RedisStore",
+    "MemoryStore",
+    "QueryState",
+    "QueryField",
+    "PlaceholderSnapshot",
+    "ComponentCapabilities",
+    "get_capabilities",
+    "register_capabilities",
+    "Cond",
+    "Condition",
+    "Lazy",
+    "HASH_FUNCS",
+]
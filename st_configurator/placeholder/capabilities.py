@@ -0,0 +1,143 @@
+import inspect
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from streamlit.delta_generator import DeltaGenerator
+
+
+@dataclass(frozen=True)
+class ComponentCapabilities:
+    """
+    What the renderer needs to know about a component's call signature.
+
+    Attributes:
+        has_key (bool): Whether the component accepts a 'key' argument.
+        var_kwargs (bool): Whether the component accepts '**kwargs'.
+        var_args (bool): Whether the component accepts '*args'.
+        positional (Tuple[str, ...], optional): Names of the parameters that
+            can be passed positionally, in order. None if unknown.
+        accepts_state (bool): Whether the widget it creates takes values
+            written to st.session_state; Streamlit refuses them for buttons,
+            file uploaders and similar widgets.
+    """
+
+    has_key: bool = False
+    var_kwargs: bool = False
+    var_args: bool = False
+    positional: Optional[Tuple[str, ...]] = None
+    accepts_state: bool = True
+
+
+# Used for callables without an introspectable signature (builtins, some C
+# extensions); nothing is injected into their calls.
+UNKNOWN_CAPABILITIES = ComponentCapabilities()
+
+# Streamlit widgets whose value cannot be set through st.session_state.
+_STATELESS_WIDGETS = (
+    "audio_input",
+    "button",
+    "camera_input",
+    "data_editor",
+    "download_button",
+    "file_uploader",
+    "form_submit_button",
+)
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+_weak_cache: "weakref.WeakKeyDictionary[Callable, ComponentCapabilities]" = (
+    weakref.WeakKeyDictionary()
+)
+# Callables that cannot be weakly referenced, e.g. builtin functions.
+_strong_cache: Dict[Callable, ComponentCapabilities] = {}
+_lock = threading.Lock()
+
+
+def _accepts_state(obj: Callable) -> bool:
+    # st.button and st.sidebar.button are bound methods of DeltaGenerator.
+    function = getattr(obj, "__func__", obj)
+    return not any(
+        getattr(DeltaGenerator, name, None) is function
+        for name in _STATELESS_WIDGETS
+    )
+
+
+def _inspect_capabilities(obj: Callable) -> ComponentCapabilities:
+    try:
+        parameters = inspect.signature(obj).parameters
+    except (TypeError, ValueError):
+        return UNKNOWN_CAPABILITIES
+
+    kinds = [param.kind for param in parameters.values()]
+    return ComponentCapabilities(
+        has_key="key" in parameters,
+        var_kwargs=inspect.Parameter.VAR_KEYWORD in kinds,
+        var_args=inspect.Parameter.VAR_POSITIONAL in kinds,
+        positional=tuple(
+            name
+            for name, param in parameters.items()
+            if param.kind in _POSITIONAL_KINDS
+        ),
+        accepts_state=_accepts_state(obj),
+    )
+
+
+def _store(obj: Callable, capabilities: ComponentCapabilities) -> None:
+    with _lock:
+        try:
+            _weak_cache[obj] = capabilities
+        except TypeError:
+            try:
+                _strong_cache[obj] = capabilities
+            except TypeError:
+                # Unhashable callables are simply inspected on every call.
+                pass
+
+
+def get_capabilities(obj: Callable) -> ComponentCapabilities:
+    """
+    Returns the cached capabilities of a component, inspecting its signature
+    on first use.
+    """
+    try:
+        capabilities = _weak_cache.get(obj)
+    except TypeError:
+        try:
+            capabilities = _strong_cache.get(obj)
+        except TypeError:
+            capabilities = None
+    if capabilities is None:
+        capabilities = _inspect_capabilities(obj)
+        _store(obj, capabilities)
+    return capabilities
+
+
+def register_capabilities(
+    obj: Callable,
+    *,
+    has_key: bool = False,
+    var_kwargs: bool = False,
+    var_args: bool = False,
+    positional: Optional[Tuple[str, ...]] = None,
+    accepts_state: bool = True,
+) -> ComponentCapabilities:
+    """
+    Registers the capabilities of a component up front.
+
+    Useful for third-party components whose signature cannot be inspected
+    (or is misleading, e.g. a '**kwargs' wrapper that forwards 'key').
+    """
+    capabilities = ComponentCapabilities(
+        has_key=has_key,
+        var_kwargs=var_kwargs,
+        var_args=var_args,
+        positional=tuple(positional) if positional is not None else None,
+        accepts_state=accepts_state,
+    )
+    _store(obj, capabilities)
+    return capabilities
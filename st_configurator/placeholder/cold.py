@@ -0,0 +1,231 @@
+import atexit
+import lzma
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import streamlit as st
+
+from .context import (
+    DERIVED_KEY,
+    FORMATTED_KEY,
+    PERSIST_KEY,
+    VALUES_KEY,
+    VERSIONS_KEY,
+    bound_stores,
+    current_pass,
+)
+from .storage import RESERVED_NAMESPACES
+
+COLD_KEY = "_placeholder_cold"
+
+# Stores whose page namespaces are frozen; derived and formatted values are
+# caches, dropped instead and recomputed on return.
+_FROZEN_STORES = (VALUES_KEY, VERSIONS_KEY, PERSIST_KEY)
+_CACHE_STORES = (DERIVED_KEY, FORMATTED_KEY)
+
+_CODECS = {
+    None: (lambda data: data, lambda data: data),
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+@dataclass(frozen=True)
+class ColdStorage:
+    """
+    Where render_page moves the placeholder state of the page a session
+    navigated away from, until the page is rendered again.
+
+    Attributes:
+        compression (str, optional): "zlib", "lzma" or None to only pickle.
+            Defaults to "zlib".
+        spill_dir (str, optional): Directory to write frozen pages to instead
+            of keeping them in memory; "" for a private directory created in
+            the system temp directory. Spilled pages are unpickled when they
+            are read back, so the directory must not be writable by other
+            users. Defaults to None.
+    """
+
+    compression: Optional[str] = "zlib"
+    spill_dir: Optional[str] = None
+
+    def __post_init__(self):
+        if self.compression not in _CODECS:
+            raise ValueError(
+                f"Unknown compression {self.compression!r}; expected "
+                f"'zlib', 'lzma' or None."
+            )
+
+
+_cold_storage: Optional[ColdStorage] = None
+_private_dir: Optional[str] = None
+_private_dir_lock = threading.Lock()
+
+
+def set_cold_storage(storage: Optional[ColdStorage]) -> None:
+    global _cold_storage
+    _cold_storage = storage
+
+
+def _spill_directory(spill_dir: str) -> str:
+    global _private_dir
+    if spill_dir:
+        return spill_dir
+    with _private_dir_lock:
+        if _private_dir is None:
+            # Created with mode 0o700, so other users cannot swap files in.
+            _private_dir = tempfile.mkdtemp(prefix="st_configurator_")
+            atexit.register(shutil.rmtree, _private_dir, True)
+    return _private_dir
+
+
+def _remove_files(paths: Dict[Any, str]) -> None:
+    for path in list(paths.values()):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class ColdPages:
+    """
+    The frozen pages of a session: the compression used and either the
+    compressed state or, for spilled pages, None and a file path in
+    'paths'. Spill files are removed once the session state is collected.
+    """
+
+    __slots__ = ("last_page", "frozen", "token", "paths", "__weakref__")
+
+    def __init__(self):
+        self.last_page: Any = None
+        self.frozen: Dict[Any, Tuple[Optional[str], Optional[bytes]]] = {}
+        self.token = uuid.uuid4().hex
+        self.paths: Dict[Any, str] = {}
+        weakref.finalize(self, _remove_files, self.paths)
+
+    def spill(self, spill_dir: str, page_tag: Any, data: bytes) -> None:
+        """
+        Writes a frozen page to a new file only this user can read.
+        """
+        fd, path = tempfile.mkstemp(
+            prefix=f"st_configurator_{self.token}_",
+            suffix=".bin",
+            dir=_spill_directory(spill_dir),
+        )
+        self.paths[page_tag] = path
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+
+    def discard(self, page_tag: Any) -> None:
+        self.frozen.pop(page_tag, None)
+        path = self.paths.pop(page_tag, None)
+        if path is not None:
+            _remove_files({page_tag: path})
+
+
+def _cold_pages() -> ColdPages:
+    cold = st.session_state.get(COLD_KEY)
+    if cold is None:
+        cold = st.session_state[COLD_KEY] = ColdPages()
+    return cold
+
+
+def freeze_page(page_tag: Any) -> bool:
+    """
+    Moves a page's placeholder state out of the session stores into cold
+    storage. Returns False, leaving the page as it was, if cold storage is
+    not enabled or the state cannot be pickled.
+    """
+    storage = _cold_storage
+    if storage is None or page_tag in RESERVED_NAMESPACES:
+        return False
+    buckets = [
+        store.buckets.get(page_tag) for store in bound_stores(_FROZEN_STORES)
+    ]
+    if not any(buckets):
+        return False
+    compress = _CODECS[storage.compression][0]
+    try:
+        data = compress(
+            pickle.dumps(buckets, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except Exception:
+        # e.g. values holding open connections or lambdas stay in memory.
+        return False
+
+    cold = _cold_pages()
+    cold.discard(page_tag)
+    if storage.spill_dir is not None:
+        try:
+            cold.spill(storage.spill_dir, page_tag, data)
+        except OSError:
+            cold.discard(page_tag)
+            return False
+        data = None
+    cold.frozen[page_tag] = (storage.compression, data)
+    for store in bound_stores(_FROZEN_STORES + _CACHE_STORES):
+        store.drop_namespace(page_tag)
+    return True
+
+
+def thaw_page(page_tag: Any) -> bool:
+    """
+    Moves a frozen page's state back into the session stores. Values
+    written to the page while it was frozen win over the frozen ones.
+    """
+    cold = st.session_state.get(COLD_KEY)
+    if cold is None or page_tag not in cold.frozen:
+        return False
+    compression, data = cold.frozen[page_tag]
+    if data is None:
+        try:
+            with open(cold.paths[page_tag], "rb") as file:
+                data = file.read()
+        except OSError:
+            # e.g. pruned from the temp directory: the page was evicted.
+            cold.discard(page_tag)
+            return False
+    buckets = pickle.loads(_CODECS[compression][1](data))
+    cold.discard(page_tag)
+    for store, bucket in zip(bound_stores(_FROZEN_STORES), buckets):
+        if bucket is None:
+            continue
+        bucket.update(store.buckets.get(page_tag, {}))
+        store.buckets[page_tag] = bucket
+    render = current_pass()
+    if render is not None:
+        render.resolved.clear()
+    return True
+
+
+def discard_page(page_tag: Any) -> None:
+    """
+    Drops a page's frozen state, if any.
+    """
+    cold = st.session_state.get(COLD_KEY)
+    if cold is not None:
+        cold.discard(page_tag)
+
+
+def switch_page(page_tag: Any) -> None:
+    """
+    Called when a page renders: thaws it if it was frozen and, with cold
+    storage enabled, freezes the page the session was on before.
+    """
+    cold = st.session_state.get(COLD_KEY)
+    if cold is not None and cold.frozen:
+        thaw_page(page_tag)
+    if _cold_storage is None:
+        return
+    cold = _cold_pages()
+    previous, cold.last_page = cold.last_page, page_tag
+    if previous is not None and previous != page_tag:
+        freeze_page(previous)
@@ -0,0 +1,274 @@
+import operator
+from typing import Any, Callable, FrozenSet, Iterable, Tuple
+
+from .context import lookup_memo, store_memo, tracked_reads
+
+# Evaluation cost classes; all/any evaluate cheaper operands first.
+_CONSTANT_COST = 0
+_PLACEHOLDER_COST = 1
+_COMPONENT_COST = 10
+
+_OPERATOR_SYMBOLS = {
+    operator.eq: "==",
+    operator.ne: "!=",
+    operator.lt: "<",
+    operator.le: "<=",
+    operator.gt: ">",
+    operator.ge: ">=",
+}
+
+
+class Condition:
+    """
+    A compiled condition expression.
+
+    Conditions are built with 'Cond' or the comparison methods of a
+    PlaceholderValue (e.g. 'MyPlaceholder.MODE.eq("advanced")') and can be
+    used anywhere a ComponentConfig accepts a 'condition'. Each one is
+    compiled into a closure when it is built, so evaluating it is a plain
+    function call.
+
+    Attributes:
+        dependencies (FrozenSet[PlaceholderValue]): Placeholders the condition
+            reads. For conditions calling a ComponentConfig, only the
+            placeholders passed to it are known.
+        cost (int): Relative evaluation cost, used to order operands.
+    """
+
+    __slots__ = ("_fn", "cost", "dependencies", "_description", "__weakref__")
+
+    def __init__(
+        self,
+        fn: Callable[[], Any],
+        cost: int,
+        dependencies: FrozenSet,
+        description: str,
+    ):
+        self._fn = fn
+        self.cost = cost
+        self.dependencies = dependencies
+        self._description = description
+
+    def evaluate(self) -> bool:
+        return bool(self._fn())
+
+    def __and__(self, other) -> "Condition":
+        return Cond.all(self, other)
+
+    def __rand__(self, other) -> "Condition":
+        return Cond.all(other, self)
+
+    def __or__(self, other) -> "Condition":
+        return Cond.any(self, other)
+
+    def __ror__(self, other) -> "Condition":
+        return Cond.any(other, self)
+
+    def __invert__(self) -> "Condition":
+        return Cond.not_(self)
+
+    def __bool__(self):
+        raise TypeError(
+            "A Condition has no truth value until it is evaluated; pass it "
+            "as a ComponentConfig condition or call .evaluate()."
+        )
+
+    def __repr__(self):
+        return f"<Condition {self._description}>"
+
+
+class Comparison(Condition):
+    """
+    A placeholder compared with a value.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, placeholder, op: Callable, value: Any):
+        get = placeholder.get
+        super().__init__(
+            lambda: op(get(), value),
+            _PLACEHOLDER_COST,
+            frozenset((placeholder,)),
+            f"{placeholder._name} {_OPERATOR_SYMBOLS[op]} {value!r}",
+        )
+
+
+def _truth(placeholder) -> Condition:
+    return Condition(
+        placeholder.get,
+        _PLACEHOLDER_COST,
+        frozenset((placeholder,)),
+        str(placeholder._name),
+    )
+
+
+def _call(config) -> Condition:
+    from .placeholder import Placeholder, PlaceholderValue
+
+    component = config.component
+    args = config.args
+    kwargs = config.kwargs
+    result_key = config.result_key
+
+    def _build():
+        new_args, new_kwargs = Placeholder.update_param_placeholders(
+            component, args, kwargs, result_key
+        )
+        result = component(*new_args, **new_kwargs)
+        if result_key is not None:
+            result_key.set(result)
+        return result
+
+    fn = _build
+    if config.memoize:
+
+        def fn():
+            hit, result = lookup_memo(condition)
+            if hit:
+                return result
+            with tracked_reads() as reads:
+                result = _build()
+            store_memo(condition, reads, result)
+            return result
+
+    condition = Condition(
+        fn,
+        _COMPONENT_COST,
+        frozenset(
+            value
+            for value in (*args, *kwargs.values())
+            if isinstance(value, PlaceholderValue)
+        ),
+        getattr(component, "__name__", repr(component)) + "(...)",
+    )
+    return condition
+
+
+def _operand(operand) -> Condition:
+    from st_configurator.layout_schema import ComponentConfig
+
+    from .placeholder import PlaceholderValue
+
+    if isinstance(operand, Condition):
+        return operand
+    if isinstance(operand, PlaceholderValue):
+        return _truth(operand)
+    if isinstance(operand, ComponentConfig):
+        return _call(operand)
+    if isinstance(operand, bool):
+        return Condition(
+            (lambda: operand), _CONSTANT_COST, frozenset(), repr(operand)
+        )
+    raise TypeError(
+        f"Cannot use {operand!r} in a condition; expected a Condition, "
+        f"PlaceholderValue, ComponentConfig or bool."
+    )
+
+
+def _operands(operands: Iterable, kind: str) -> Tuple[Condition, ...]:
+    flat = []
+    for operand in map(_operand, operands):
+        # Nested all/any of the same kind are merged into one level.
+        if getattr(operand, "_kind", None) == kind:
+            flat.extend(operand._operands)
+        else:
+            flat.append(operand)
+    # Stable sort: cheap placeholder checks short-circuit expensive calls.
+    return tuple(sorted(flat, key=lambda operand: operand.cost))
+
+
+class _Junction(Condition):
+    __slots__ = ("_kind", "_operands")
+
+    def __init__(self, kind: str, operands: Tuple[Condition, ...]):
+        fns = tuple(operand._fn for operand in operands)
+        if kind == "all":
+
+            def fn():
+                for f in fns:
+                    if not f():
+                        return False
+                return True
+
+        else:
+
+            def fn():
+                for f in fns:
+                    if f():
+                        return True
+                return False
+
+        super().__init__(
+            fn,
+            sum(operand.cost for operand in operands),
+            frozenset().union(*(op.dependencies for op in operands)),
+            f" {'&' if kind == 'all' else '|'} ".join(
+                f"({operand._description})" for operand in operands
+            ),
+        )
+        self._kind = kind
+        self._operands = operands
+
+
+class Cond:
+    """
+    Builders for condition expressions.
+
+    Example:
+        Cond.all(
+            MyPlaceholder.MODE.eq("advanced"),
+            Cond.not_(MyPlaceholder.READ_ONLY),
+            MyPlaceholder.REGION.isin({"EU", "US"}),
+        )
+    """
+
+    @staticmethod
+    def of(operand) -> Condition:
+        """
+        Wraps a PlaceholderValue (truthiness), a ComponentConfig (its return
+        value) or a bool as a Condition.
+        """
+        return _operand(operand)
+
+    @staticmethod
+    def all(*operands) -> Condition:
+        return _Junction("all", _operands(operands, "all"))
+
+    @staticmethod
+    def any(*operands) -> Condition:
+        return _Junction("any", _operands(operands, "any"))
+
+    @staticmethod
+    def not_(operand) -> Condition:
+        inner = _operand(operand)
+        fn = inner._fn
+        return Condition(
+            lambda: not fn(),
+            inner.cost,
+            inner.dependencies,
+            f"not ({inner._description})",
+        )
+
+    @staticmethod
+    def isin(placeholder, values: Iterable) -> Condition:
+        values = tuple(values)
+        try:
+            values = frozenset(values)
+        except TypeError:
+            pass
+        get = placeholder.get
+
+        def fn():
+            try:
+                return get() in values
+            except TypeError:
+                # Unhashable values cannot be members of a frozenset.
+                return False
+
+        return Condition(
+            fn,
+            _PLACEHOLDER_COST,
+            frozenset((placeholder,)),
+            f"{placeholder._name} in {list(values)!r}",
+        )
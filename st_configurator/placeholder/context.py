@@ -0,0 +1,398 @@
+import itertools
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+from .storage import PROCESS_STORE, NamespacedStore, session_store
+
+VALUES_KEY = "_placeholder_values"
+VERSIONS_KEY = "_placeholder_versions"
+MEMO_KEY = "_placeholder_memo"
+DERIVED_KEY = "_placeholder_derived"
+FORMATTED_KEY = "_placeholder_formatted"
+PERSIST_KEY = "_persist"
+OVERRIDES_KEY = "_placeholder_overrides"
+WIDGET_VERSIONS_KEY = "_placeholder_widget_versions"
+STATELESS_KEY = "_placeholder_stateless_widgets"
+
+# Stands in for "no stored value" in recorded reads.
+MISSING = object()
+
+# Versions are unique across keys and sessions, so a (key, version) pair
+# identifies one write for the lifetime of the process.
+_version_counter = itertools.count(1)
+
+Reads = Dict[str, Tuple[int, Any]]
+
+_tracked_reads: ContextVar[Optional[Reads]] = ContextVar(
+    "st_configurator_tracked_reads", default=None
+)
+_render_pass: ContextVar[Optional["RenderPass"]] = ContextVar(
+    "st_configurator_render_pass", default=None
+)
+_pending_writes: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "st_configurator_pending_writes", default=None
+)
+
+
+def next_version() -> int:
+    return next(_version_counter)
+
+
+class RenderPass:
+    """
+    State bound once per render pass.
+
+    Holds the session-state dicts placeholders are stored in, so they are
+    fetched from st.session_state once instead of on every access, the keys
+    and values placeholders resolved to during the pass, and a memo for
+    values computed during the pass.
+
+    Values written to st.session_state directly, bypassing
+    PlaceholderValue.set, are only seen by the next pass.
+    """
+
+    __slots__ = (
+        "values",
+        "versions",
+        "persist",
+        "derived",
+        "formatted",
+        "keys",
+        "resolved",
+        "memo",
+        "touched",
+        "overrides",
+    )
+
+    def __init__(self):
+        self.memo: Dict[int, Any] = {}
+        # Placeholders read or written during the pass, by key.
+        self.touched: Dict[str, Any] = {}
+        self.bind()
+
+    def bind(self) -> None:
+        """
+        (Re)binds the session-state dicts and forgets resolved values.
+        """
+        self.values: NamespacedStore = session_store(VALUES_KEY)
+        self.versions: NamespacedStore = session_store(VERSIONS_KEY)
+        self.persist: NamespacedStore = session_store(PERSIST_KEY)
+        self.derived: NamespacedStore = session_store(DERIVED_KEY)
+        self.formatted: NamespacedStore = session_store(FORMATTED_KEY)
+        self.overrides: Dict[str, str] = session_overrides()
+        self.keys: Dict[Any, str] = {}
+        self.resolved: Dict[str, Tuple[Any, Any, Any]] = {}
+
+
+def session_overrides() -> Dict[str, str]:
+    """
+    Returns the widget keys given explicitly to placeholders in this
+    session, by the placeholder's storage key.
+    """
+    overrides = st.session_state.get(OVERRIDES_KEY)
+    if overrides is None:
+        overrides = st.session_state[OVERRIDES_KEY] = {}
+    return overrides
+
+
+def mark_stateless(key: str) -> None:
+    """
+    Records that a widget refusing st.session_state writes, e.g. a button
+    or a file uploader, uses 'key' in this session.
+    """
+    stateless = st.session_state.get(STATELESS_KEY)
+    if stateless is None:
+        stateless = st.session_state[STATELESS_KEY] = set()
+    stateless.add(key)
+
+
+def accepts_state(key: str) -> bool:
+    """
+    Returns whether st.session_state[key] may be written: setting the
+    state of a button or a file uploader makes Streamlit raise when the
+    widget is next rendered.
+    """
+    stateless = st.session_state.get(STATELESS_KEY)
+    return not stateless or key not in stateless
+
+
+def current_pass() -> Optional[RenderPass]:
+    """
+    Returns the current render pass, or None outside of one.
+    """
+    return _render_pass.get()
+
+
+@contextmanager
+def render_pass() -> Iterator[RenderPass]:
+    """
+    Opens a render pass, torn down once the page has rendered.
+
+    Nested passes share the outermost one, so rendering a layout from inside
+    a page render stays in the page's pass.
+    """
+    current = _render_pass.get()
+    if current is not None:
+        yield current
+        return
+    current = RenderPass()
+    token = _render_pass.set(current)
+    try:
+        yield current
+    finally:
+        _render_pass.reset(token)
+
+
+_STORE_ATTRS = {
+    VALUES_KEY: "values",
+    VERSIONS_KEY: "versions",
+    PERSIST_KEY: "persist",
+    DERIVED_KEY: "derived",
+    FORMATTED_KEY: "formatted",
+}
+STORE_KEYS = tuple(_STORE_ATTRS)
+
+
+def _bound_store(attr: str, name: str) -> NamespacedStore:
+    current = _render_pass.get()
+    if current is not None:
+        return getattr(current, attr)
+    return session_store(name)
+
+
+def bound_stores(names=STORE_KEYS) -> List[NamespacedStore]:
+    """
+    Returns the named session stores, as bound by the current render pass.
+    """
+    return [_bound_store(_STORE_ATTRS[name], name) for name in names]
+
+
+def derived_results() -> NamespacedStore:
+    return _bound_store("derived", DERIVED_KEY)
+
+
+def formatted_values() -> NamespacedStore:
+    return _bound_store("formatted", FORMATTED_KEY)
+
+
+def _versions() -> NamespacedStore:
+    return _bound_store("versions", VERSIONS_KEY)
+
+
+def unchanged(old: Any, new: Any) -> bool:
+    # Widget values may be rebuilt as equal but distinct objects on rerun.
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
+
+# Values cheap enough to compare directly; anything else is compared by
+# version only, so a new object counts as a new value.
+_SCALAR_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def fingerprint(value: Any) -> Any:
+    """
+    Returns an O(1)-comparable stand-in for a value: the value itself for
+    scalars, None for anything else.
+    """
+    if type(value) in _SCALAR_TYPES:
+        return type(value), value
+    return None
+
+
+def shared_version(key: str) -> int:
+    """
+    Returns the version of the value published for a process-wide
+    placeholder key, 0 if none was.
+    """
+    entry = PROCESS_STORE.get(key)
+    return entry[0] if entry is not None else 0
+
+
+def _version(versions: NamespacedStore, key: str) -> int:
+    # Keys without a write of their own follow the value published for the
+    # whole process, if any.
+    version = versions.get(key)
+    return version if version is not None else shared_version(key)
+
+
+def current_version(key: str) -> int:
+    """
+    Returns the version of a placeholder key, 0 if it was never written.
+
+    A widget value set() has not stored yet (e.g. one changed in the browser
+    before its widget reran) gets a version of its own, without being
+    copied into the store; set() adopts that version when it stores it.
+    """
+    current = _render_pass.get()
+    if current is not None:
+        values, versions = current.values, current.versions
+    else:
+        values = session_store(VALUES_KEY)
+        versions = session_store(VERSIONS_KEY)
+    version = _version(versions, key)
+    if key not in st.session_state:
+        return version
+    raw = st.session_state[key]
+    if unchanged(values.get(key, MISSING), raw):
+        return version
+    # Valid while the stored version is unchanged: widget state only changes
+    # between reruns, and a rendered widget's value is stored by set().
+    marker = (version, fingerprint(raw))
+    pending = session_store(WIDGET_VERSIONS_KEY)
+    entry = pending.get(key)
+    if entry is None or entry[0] != marker:
+        entry = pending[key] = (marker, next_version())
+    return entry[1]
+
+
+def written_version(key: str, value: Any) -> int:
+    """
+    Returns the version of a new write of 'value' to a key: the one
+    current_version already gave it if it is the key's widget value, a new
+    one otherwise.
+    """
+    pending = st.session_state.get(WIDGET_VERSIONS_KEY)
+    entry = pending.pop(key, None) if pending else None
+    if (
+        entry is not None
+        and key in st.session_state
+        and unchanged(st.session_state[key], value)
+    ):
+        return entry[1]
+    return next_version()
+
+
+def read_state(key: str) -> Tuple[int, Any]:
+    """
+    Returns the current version and raw stored value of a placeholder key,
+    or MISSING if nothing is stored for it.
+    """
+    current = _render_pass.get()
+    if key in st.session_state:
+        raw = st.session_state[key]
+    elif current is not None:
+        raw = current.values.get(key, MISSING)
+    else:
+        raw = session_store(VALUES_KEY).get(key, MISSING)
+    if raw is MISSING:
+        entry = PROCESS_STORE.get(key)
+        if entry is not None:
+            raw = entry[1]
+    return current_version(key), raw
+
+
+def record_read(key: str, raw: Any) -> None:
+    reads = _tracked_reads.get()
+    if reads is not None and key not in reads:
+        reads[key] = (current_version(key), raw)
+
+
+@contextmanager
+def tracked_reads() -> Iterator[Reads]:
+    """
+    Collects the version and raw value of every placeholder read inside the
+    block. Reads made inside nested blocks are also reported to the outer one.
+    """
+    outer = _tracked_reads.get()
+    reads: Reads = {}
+    token = _tracked_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _tracked_reads.reset(token)
+        if outer is not None:
+            for key, read in reads.items():
+                outer.setdefault(key, read)
+
+
+def pending_writes() -> Optional[Dict[str, Any]]:
+    """
+    Returns the writes collected by the current batch, or None outside of
+    one.
+    """
+    return _pending_writes.get()
+
+
+@contextmanager
+def collect_writes() -> Iterator[Dict[str, Any]]:
+    pending: Dict[str, Any] = {}
+    token = _pending_writes.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_writes.reset(token)
+
+
+def replay_reads(reads: Reads) -> None:
+    """
+    Reports reads recorded earlier to the enclosing tracked_reads block, as
+    if they had just been made.
+    """
+    outer = _tracked_reads.get()
+    if outer is not None:
+        for key, read in reads.items():
+            outer.setdefault(key, read)
+
+
+def reads_current(reads: Reads) -> bool:
+    for key, (version, raw) in reads.items():
+        version_now, raw_now = read_state(key)
+        if version_now != version or not unchanged(raw, raw_now):
+            return False
+    return True
+
+
+class MemoTable(dict):
+    """
+    Session-scoped memoized results, keyed by the id of their owner.
+
+    Entries hold a weak reference to the owner, so an id reused by a new
+    object never produces a hit; entries of collected owners are swept out
+    once the table doubles in size.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sweep_at = 64
+
+    def sweep(self) -> None:
+        for key in [key for key, entry in self.items() if entry[0]() is None]:
+            del self[key]
+        self.sweep_at = max(64, 2 * len(self))
+
+
+def lookup_memo(owner) -> Tuple[bool, Any]:
+    """
+    Returns (True, value) if 'owner' has a memoized value whose recorded
+    placeholder reads are all still current, else (False, None).
+    """
+    memo = st.session_state.get(MEMO_KEY)
+    if memo is None:
+        return False, None
+    entry = memo.get(id(owner))
+    if entry is None or entry[0]() is not owner:
+        return False, None
+    if not reads_current(entry[1]):
+        return False, None
+    replay_reads(entry[1])
+    return True, entry[2]
+
+
+def store_memo(owner, reads: Reads, value: Any) -> None:
+    memo = st.session_state.get(MEMO_KEY)
+    if memo is None:
+        memo = st.session_state[MEMO_KEY] = MemoTable()
+    memo[id(owner)] = (weakref.ref(owner), dict(reads), value)
+    if len(memo) >= memo.sweep_at:
+        memo.sweep()
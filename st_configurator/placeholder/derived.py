@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence, Union
+
+from .context import (
+    derived_results,
+    fingerprint,
+    next_version,
+    pending_writes,
+)
+from .placeholder import HASH_FUNCS, PlaceholderValue
+
+
+class DerivedPlaceholder(PlaceholderValue):
+    """
+    A read-only placeholder computed from other placeholders.
+
+    The value is fn(*values of deps), recomputed lazily when it is read and
+    the version of a dependency has changed. The last 'cache_size' results
+    are kept per session, keyed by the versions of the dependencies, so
+    switching back to earlier scalar inputs (e.g. a selectbox option) is
+    free. Entries keep no reference to the input values.
+    It can be used wherever a PlaceholderValue is accepted, except as a
+    'result_key'.
+
+    Example:
+        class MyPlaceholder(Placeholder):
+            RAW_DF = None
+            REGION = "EU"
+            FILTERED = DerivedPlaceholder(
+                lambda df, region: df[df.region == region],
+                deps=["RAW_DF", "REGION"],
+            )
+    """
+
+    def __init__(
+        self,
+        fn: Callable,
+        deps: Sequence[Union[PlaceholderValue, str]],
+        cache_size: int = 4,
+        name=None,
+        global_scope=False,
+        format_fn: Optional[Callable] = None,
+    ):
+        """Initialize the derived placeholder.
+        Args:
+            fn (Callable): Computes the value from the values of 'deps'.
+            deps (Sequence[PlaceholderValue | str]): Placeholders the value is computed from, in the order 'fn' takes them. Placeholders declared on the same class are given by name.
+            cache_size (int): Number of results kept per session. Defaults to 4.
+            name (str, optional): Custom name for the placeholder. Will be auto-generated if not specified. Defaults to None.
+            global_scope (bool): Whether the placeholder is accessible globally across all pages. Defaults to False.
+            format_fn (Callable, optional): Function to format the value. Defaults to None.
+        """
+        for dep in deps:
+            if not isinstance(dep, (PlaceholderValue, str)):
+                raise TypeError(
+                    f"DerivedPlaceholder dependencies must be "
+                    f"PlaceholderValues or the names of placeholders on the "
+                    f"same class, got {dep!r}."
+                )
+        super().__init__(
+            name=name, global_scope=global_scope, format_fn=format_fn
+        )
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.cache_size = max(1, cache_size)
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        deps = []
+        for dep in self.deps:
+            if isinstance(dep, str):
+                resolved = getattr(owner, dep, None)
+                if not isinstance(resolved, PlaceholderValue):
+                    raise TypeError(
+                        f"{owner.__name__} has no placeholder named "
+                        f"{dep!r} for {name} to depend on."
+                    )
+                dep = resolved
+            deps.append(dep)
+        self.deps = tuple(deps)
+
+    def _entry(self, key):
+        # Reading the dependencies records them as reads of whoever reads
+        # this placeholder, e.g. a memoized condition.
+        values = [dep.get() for dep in self.deps]
+        signature = tuple(dep.cache_key() for dep in self.deps)
+        pending = pending_writes()
+        if pending is not None and any(
+            dep_key in pending for dep_key, _ in signature
+        ):
+            # Inside a batch, pending values have no version of their own
+            # yet, so the result is not cached.
+            return next_version(), self.fn(*values), None
+        results = derived_results().setdefault(key, OrderedDict())
+        entry = results.get(signature)
+        prints = tuple(map(fingerprint, values))
+        if entry is None:
+            # New versions may still hold the values of an earlier entry,
+            # e.g. after switching a selectbox back to a previous option.
+            # Only scalars are compared, by fingerprint, so entries never
+            # keep large inputs such as frames alive; other inputs must be
+            # at the same version.
+            for old_signature, old_entry in reversed(results.items()):
+                if all(
+                    old == new or (now is not None and then == now)
+                    for old, new, then, now in zip(
+                        old_signature, signature, old_entry[2], prints
+                    )
+                ):
+                    del results[old_signature]
+                    entry = results[signature] = old_entry
+                    break
+        if entry is not None:
+            results.move_to_end(signature)
+            return entry
+        entry = results[signature] = (
+            next_version(),
+            self.fn(*values),
+            prints,
+        )
+        if len(results) > self.cache_size:
+            results.popitem(last=False)
+        return entry
+
+    def get(self, *, key=None):
+        if key is None:
+            key = self.get_key()
+        version, val = self._entry(key)[:2]
+        if self.format_fn:
+            val = self._format(key, val, version)
+        return val
+
+    def version(self, *, key=None) -> int:
+        if key is None:
+            key = self.get_key()
+        return self._entry(key)[0]
+
+    def cache_key(self, *, key=None):
+        if key is None:
+            key = self.get_key()
+        return key, self._entry(key)[0]
+
+    def set(self, value, *, key=None):
+        raise AttributeError(
+            f"{self._name} is a DerivedPlaceholder; its value is computed "
+            f"from its dependencies and cannot be set."
+        )
+
+    def __repr__(self):
+        return f"<DerivedPlaceholder name={self._name}>"
+
+
+HASH_FUNCS[DerivedPlaceholder] = DerivedPlaceholder.cache_key
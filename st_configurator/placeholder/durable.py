@@ -0,0 +1,295 @@
+import abc
+import atexit
+import pickle
+import queue
+import sqlite3
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import streamlit as st
+
+from .context import PERSIST_KEY, bound_stores, current_version, fingerprint
+from .storage import GLOBAL_NAMESPACE, namespace_of, scoped_key
+
+LOADED_KEY = "_placeholder_durable_loaded"
+
+
+class PersistenceBackend(abc.ABC):
+    """
+    Durable storage for the locked values of persist=True placeholders,
+    kept per identity (e.g. a user id) so they survive server restarts and
+    reconnects.
+
+    Subclasses implement 'load', 'save' and 'forget'; 'save' and 'forget'
+    are called from the render thread and should not block on I/O.
+    """
+
+    @abc.abstractmethod
+    def load(
+        self, identity: str, namespaces: Sequence[str]
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Returns the saved values of an identity in the given namespaces, by
+        (namespace, placeholder name).
+        """
+
+    @abc.abstractmethod
+    def save(
+        self, identity: str, namespace: str, name: str, value: Any
+    ) -> None:
+        """
+        Saves the locked value of a placeholder.
+        """
+
+    @abc.abstractmethod
+    def forget(self, identity: str, namespace: str) -> None:
+        """
+        Deletes the saved values of an identity in a namespace.
+        """
+
+    def flush(self) -> None:
+        """
+        Blocks until every write made so far is durable.
+        """
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS placeholder_values (
+    identity TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (identity, namespace, name)
+)
+"""
+
+_STOP = object()
+
+
+class SQLiteBackend(PersistenceBackend):
+    """
+    A PersistenceBackend writing to a local SQLite database.
+
+    Writes are queued and applied behind the render thread by a writer
+    thread, up to 'batch_size' in one transaction. The database runs in WAL
+    mode with a busy timeout, so several server processes on one host can
+    share the file. Values are pickled; only point it at a trusted file.
+
+    Args:
+        path (str): Database file, created if missing.
+        batch_size (int): Most writes applied per transaction. Defaults to 256.
+        timeout (float): Seconds to wait for another process's lock. Defaults to 30.
+    """
+
+    def __init__(self, path: str, batch_size: int = 256, timeout: float = 30):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._connect().executescript(_SCHEMA)
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="st_configurator-sqlite-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def load(
+        self, identity: str, namespaces: Sequence[str]
+    ) -> Dict[Tuple[str, str], Any]:
+        if self._queue.unfinished_tasks:
+            # Reads must see this process's own pending writes.
+            self.flush()
+        marks = ", ".join("?" * len(namespaces))
+        rows = self._connect().execute(
+            f"SELECT namespace, name, value FROM placeholder_values "
+            f"WHERE identity = ? AND namespace IN ({marks})",
+            (identity, *namespaces),
+        )
+        values = {}
+        for namespace, name, blob in rows:
+            try:
+                values[namespace, name] = pickle.loads(blob)
+            except Exception:
+                # Values of classes that no longer load are skipped.
+                continue
+        return values
+
+    def save(
+        self, identity: str, namespace: str, name: str, value: Any
+    ) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable values stay session-only.
+            return
+        self._queue.put(("save", (identity, namespace, name, blob)))
+
+    def forget(self, identity: str, namespace: str) -> None:
+        self._queue.put(("forget", (identity, namespace)))
+
+    def flush(self) -> None:
+        # Queue.join would wait forever for writes a dead writer never takes.
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if not self._writer.is_alive():
+                    raise RuntimeError(
+                        f"The writer thread of {self.path!r} has stopped; "
+                        f"{self._queue.unfinished_tasks} writes were not "
+                        f"applied."
+                    )
+                self._queue.all_tasks_done.wait(0.1)
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    def _write_loop(self) -> None:
+        connection = self._connect()
+        while True:
+            batch: List[Any] = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            try:
+                self._apply(
+                    connection, [item for item in batch if item is not _STOP]
+                )
+            except Exception:
+                # The batch is lost, but later writes still go through.
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _apply(
+        connection: sqlite3.Connection, batch: List[Tuple[str, Tuple]]
+    ) -> None:
+        if not batch:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for operation, params in batch:
+                if operation == "save":
+                    connection.execute(
+                        "INSERT OR REPLACE INTO placeholder_values "
+                        "(identity, namespace, name, value) "
+                        "VALUES (?, ?, ?, ?)",
+                        params,
+                    )
+                else:
+                    connection.execute(
+                        "DELETE FROM placeholder_values "
+                        "WHERE identity = ? AND namespace = ?",
+                        params,
+                    )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+
+_backend: Optional[PersistenceBackend] = None
+_identity: Optional[Callable[[], str]] = None
+
+
+def set_persistence(
+    backend: Optional[PersistenceBackend],
+    identity: Optional[Callable[[], str]] = None,
+) -> None:
+    global _backend, _identity
+    if backend is not None and identity is None:
+        # A fixed identity would share saved values between all users.
+        raise ValueError(
+            "A PersistenceBackend needs an identity: a callable returning "
+            "who the current session's values belong to."
+        )
+    _backend = backend
+    _identity = identity
+
+
+def load_persisted(page_tag: Any) -> None:
+    """
+    Loads the saved values of a page's and of global persist=True
+    placeholders, once per session, in a single backend call.
+    """
+    backend = _backend
+    if backend is None:
+        return
+    loaded = st.session_state.get(LOADED_KEY)
+    if loaded is None:
+        loaded = st.session_state[LOADED_KEY] = set()
+    namespaces = [
+        str(namespace)
+        for namespace in (page_tag, GLOBAL_NAMESPACE)
+        if str(namespace) not in loaded
+    ]
+    if not namespaces:
+        return
+    values = backend.load(_identity(), namespaces)
+    loaded.update(namespaces)
+    (persist_state,) = bound_stores((PERSIST_KEY,))
+    for (namespace, name), value in values.items():
+        key = scoped_key(namespace, name)
+        key_data = persist_state.get(key)
+        if key_data is not None and "value" in key_data:
+            continue
+        persist_state[key] = {
+            "version": current_version(key),
+            "fingerprint": fingerprint(value),
+            "value": value,
+        }
+
+
+def save_persisted(key: str, name: str, value: Any) -> None:
+    backend = _backend
+    if backend is not None:
+        backend.save(_identity(), str(namespace_of(key)), name, value)
+
+
+def forget_persisted(page_tag: Any) -> None:
+    backend = _backend
+    if backend is None:
+        return
+    backend.forget(_identity(), str(page_tag))
+    unload_persisted((page_tag,))
+
+
+def unload_persisted(namespaces: Iterable[Any]) -> None:
+    """
+    Marks namespaces whose session state was dropped as not loaded, so their
+    saved values are loaded again on the next render.
+    """
+    loaded = st.session_state.get(LOADED_KEY)
+    if loaded is not None:
+        loaded.difference_update(map(str, namespaces))
@@ -0,0 +1,331 @@
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import streamlit as st
+
+from .cold import discard_page
+from .context import (
+    MISSING,
+    WIDGET_VERSIONS_KEY,
+    bound_stores,
+    current_pass,
+)
+from .durable import unload_persisted
+from .storage import (
+    GLOBAL_NAMESPACE,
+    RESERVED_NAMESPACES,
+    SHARED_NAMESPACE,
+    namespace_of,
+    session_store,
+)
+
+USAGE_KEY = "_placeholder_usage"
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """
+    Limits on the placeholder state kept by each session, enforced after
+    every page render.
+
+    Attributes:
+        max_bytes (int, optional): Estimated size of stored values, locked
+            persisted values and derived and formatted results above which
+            the state of the least recently rendered pages is evicted. None
+            for no limit.
+        max_pages (int, optional): Number of pages whose state is kept,
+            including the current one; the least recently rendered pages are
+            evicted first. None for no limit.
+        hidden_after (int, optional): Number of renders of a page after
+            which the state of its widgets that were not rendered (e.g.
+            behind a false 'condition') is dropped. None to keep it.
+    """
+
+    max_bytes: Optional[int] = None
+    max_pages: Optional[int] = None
+    hidden_after: Optional[int] = None
+
+
+_budget: Optional[MemoryBudget] = None
+
+
+def set_memory_budget(budget: Optional[MemoryBudget]) -> None:
+    global _budget
+    _budget = budget
+
+
+def memory_budget() -> Optional[MemoryBudget]:
+    return _budget
+
+
+class SessionUsage:
+    """
+    When each page and placeholder key of a session was last used.
+
+    'renders' counts the renders of each namespace, least recently rendered
+    first; 'keys' holds, per key, the namespace's render count and the time
+    of its last use, its ttl, whether it may be evicted and whether it
+    backed a widget; 'sizes' caches estimated sizes by the version they
+    were taken at; 'touched' collects placeholders used outside of a render
+    pass until the next one.
+    """
+
+    __slots__ = ("renders", "keys", "sizes", "touched")
+
+    def __init__(self):
+        self.renders: "OrderedDict[Any, int]" = OrderedDict()
+        self.keys: Dict[
+            str, Tuple[int, float, Optional[float], bool, bool]
+        ] = {}
+        self.sizes: Dict[str, Tuple[Any, int]] = {}
+        self.touched: Dict[str, Any] = {}
+
+    def forget(self, key: str) -> None:
+        self.keys.pop(key, None)
+        self.sizes.pop(key, None)
+
+
+def _session_usage() -> SessionUsage:
+    usage = st.session_state.get(USAGE_KEY)
+    if usage is None:
+        usage = st.session_state[USAGE_KEY] = SessionUsage()
+    return usage
+
+
+def touch(key: str, placeholder: Any) -> None:
+    """
+    Records a placeholder used outside of a render pass, e.g. in a widget
+    callback, so the budget sees the use.
+    """
+    if _budget is not None:
+        _session_usage().touched[key] = placeholder
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Returns a cheap estimate of the memory held by a value, in bytes.
+
+    Arrays and frames report their own size; containers are counted one
+    level deep.
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(map(sys.getsizeof, value))
+    return size
+
+
+def drop_keys(keys: Iterable[str]) -> None:
+    """
+    Drops everything stored for the given placeholder keys, including the
+    state of widgets keyed by them.
+    """
+    stores = [*bound_stores(), session_store(WIDGET_VERSIONS_KEY)]
+    render = current_pass()
+    usage = st.session_state.get(USAGE_KEY)
+    namespaces = set()
+    for key in keys:
+        namespaces.add(namespace_of(key))
+        for store in stores:
+            store.pop(key, None)
+        if key in st.session_state:
+            del st.session_state[key]
+        if render is not None:
+            render.resolved.pop(key, None)
+        if usage is not None:
+            usage.forget(key)
+    unload_persisted(namespaces)
+
+
+def drop_page(page_tag: Any) -> None:
+    """
+    Drops everything stored for one page's placeholders, one namespace per
+    store; only widget state is removed key by key.
+    """
+    stores = [*bound_stores(), session_store(WIDGET_VERSIONS_KEY)]
+    dropped = {}
+    for store in stores:
+        dropped.update(store.drop_namespace(page_tag))
+    for key in dropped:
+        if key in st.session_state:
+            del st.session_state[key]
+    discard_page(page_tag)
+    unload_persisted((page_tag,))
+    render = current_pass()
+    if render is not None:
+        render.resolved.clear()
+    usage = st.session_state.get(USAGE_KEY)
+    if usage is not None:
+        usage.renders.pop(page_tag, None)
+        for key in [
+            key for key in usage.keys if namespace_of(key) == page_tag
+        ]:
+            usage.forget(key)
+
+
+def _pinned(usage: SessionUsage, page_tag: Any) -> Set[str]:
+    return {
+        key
+        for key, record in usage.keys.items()
+        if not record[3] and namespace_of(key) == page_tag
+    }
+
+
+def _page_keys(page_tag: Any) -> Set[str]:
+    keys: Set[str] = set()
+    for store in bound_stores():
+        keys.update(store.buckets.get(page_tag, ()))
+    return keys
+
+
+def _evict_page(usage: SessionUsage, page_tag: Any) -> None:
+    kept = _pinned(usage, page_tag)
+    if not kept:
+        drop_page(page_tag)
+        return
+    drop_keys(_page_keys(page_tag).difference(kept))
+
+
+def _key_sizes(usage: SessionUsage) -> Dict[Any, Dict[str, int]]:
+    """
+    Returns the estimated size of what each key holds, by namespace: its
+    stored and locked persisted values and its derived and formatted
+    results.
+    """
+    render = current_pass()
+    values, versions, persist = render.values, render.versions, render.persist
+    derived, formatted = render.derived, render.formatted
+    sizes: Dict[Any, Dict[str, int]] = {}
+    namespaces = {*values.buckets, *derived.buckets, *formatted.buckets}
+    for namespace in namespaces:
+        keys = {
+            *values.buckets.get(namespace, ()),
+            *derived.buckets.get(namespace, ()),
+            *formatted.buckets.get(namespace, ()),
+        }
+        key_sizes = sizes[namespace] = {}
+        for key in keys:
+            value = values.get(key, MISSING)
+            locked = persist.get(key)
+            locked = locked.get("value") if locked is not None else None
+            results = derived.get(key) or {}
+            format_entry = formatted.get(key)
+            signature = (
+                versions.get(key, 0),
+                locked is not None,
+                tuple(entry[0] for entry in results.values()),
+                format_entry[0] if format_entry is not None else None,
+            )
+            cached = usage.sizes.get(key)
+            if cached is None or cached[0] != signature:
+                size = 0 if value is MISSING else estimate_size(value)
+                if locked is not None and locked is not value:
+                    size += estimate_size(locked)
+                for entry in results.values():
+                    size += estimate_size(entry[1])
+                if format_entry is not None:
+                    size += estimate_size(format_entry[1])
+                cached = usage.sizes[key] = (signature, size)
+            key_sizes[key] = cached[1]
+    return sizes
+
+
+def enforce_budget(page_tag: Any) -> None:
+    """
+    Records the placeholders used by the current render pass and evicts the
+    state the memory budget no longer allows: keys past their ttl, hidden
+    widgets, then whole pages, least recently rendered first.
+
+    The current page and global placeholders are never evicted as pages,
+    and placeholders whose can_evict() returns False are always kept.
+    """
+    budget = _budget
+    render = current_pass()
+    if budget is None or render is None:
+        return
+    usage = _session_usage()
+
+    now = time.monotonic()
+    renders = usage.renders
+    for namespace in (page_tag, GLOBAL_NAMESPACE):
+        renders[namespace] = renders.get(namespace, 0) + 1
+        renders.move_to_end(namespace)
+    touched = {**usage.touched, **render.touched}
+    usage.touched.clear()
+    for key, placeholder in touched.items():
+        namespace = namespace_of(key)
+        if namespace == SHARED_NAMESPACE:
+            continue
+        # Streamlit drops the state of widgets that were not rendered, so
+        # whether a key backs a widget is only known when it is used.
+        usage.keys[key] = (
+            renders.get(namespace, 0),
+            now,
+            placeholder.ttl,
+            placeholder.can_evict(key),
+            key in st.session_state,
+        )
+
+    expired = []
+    for key, (seen, used_at, ttl, evictable, widget) in usage.keys.items():
+        if not evictable:
+            continue
+        if ttl is not None and now - used_at > ttl:
+            expired.append(key)
+        elif (
+            budget.hidden_after is not None
+            and widget
+            and renders.get(namespace_of(key), 0) - seen >= budget.hidden_after
+        ):
+            expired.append(key)
+    if expired:
+        drop_keys(expired)
+
+    if budget.max_pages is None and budget.max_bytes is None:
+        return
+    # Namespaces stored without ever being rendered go first. Pages holding
+    # only keys that may not be evicted are skipped.
+    stored = {
+        namespace for store in bound_stores() for namespace in store.buckets
+    }
+    candidates = [
+        namespace for namespace in stored if namespace not in renders
+    ] + [namespace for namespace in renders if namespace in stored]
+    candidates = [
+        namespace
+        for namespace in candidates
+        if namespace != page_tag
+        and namespace not in RESERVED_NAMESPACES
+        and _page_keys(namespace).difference(_pinned(usage, namespace))
+    ]
+    if budget.max_pages is not None:
+        while candidates and len(candidates) >= budget.max_pages:
+            _evict_page(usage, candidates.pop(0))
+    if budget.max_bytes is not None:
+        sizes = _key_sizes(usage)
+        total = sum(sum(keys.values()) for keys in sizes.values())
+        while candidates and total > budget.max_bytes:
+            namespace = candidates.pop(0)
+            kept = _pinned(usage, namespace)
+            total -= sum(
+                size
+                for key, size in sizes.get(namespace, {}).items()
+                if key not in kept
+            )
+            _evict_page(usage, namespace)
@@ -0,0 +1,96 @@
+from typing import Any, Callable, Iterator
+
+from .context import (
+    current_pass,
+    lookup_memo,
+    reads_current,
+    replay_reads,
+    store_memo,
+    tracked_reads,
+)
+
+
+class Lazy:
+    """
+    An argument computed only when the component receiving it renders.
+
+    'fn' is called with 'deps' once the component's condition has passed;
+    PlaceholderValues and other Lazy values among 'deps' are resolved first.
+    With memoize=True the result is reused for the rest of the render pass,
+    and with cache=True across reruns of the session, for as long as the
+    placeholders read to compute it are unchanged. Memoized generators are
+    materialized, since they can only be consumed once.
+
+    A Lazy can also be used as the 'children' of a ComponentConfig, with
+    'fn' producing the child configs.
+
+    Example:
+        ComponentConfig(
+            component=st.dataframe,
+            args=(Lazy(load_report, MyPlaceholder.REGION, memoize=True),),
+            condition=MyPlaceholder.SHOW_REPORT,
+        )
+    """
+
+    __slots__ = ("fn", "deps", "memoize", "cache", "_slots", "__weakref__")
+
+    def __init__(
+        self,
+        fn: Callable,
+        *deps,
+        memoize: bool = False,
+        cache: bool = False,
+    ):
+        from .placeholder import PlaceholderValue
+
+        self.fn = fn
+        self.deps = deps
+        self.memoize = memoize
+        self.cache = cache
+        self._slots = tuple(
+            i
+            for i, dep in enumerate(deps)
+            if isinstance(dep, (PlaceholderValue, Lazy))
+        )
+
+    def _compute(self) -> Any:
+        deps = self.deps
+        if self._slots:
+            deps = list(deps)
+            for i in self._slots:
+                deps[i] = deps[i].get()
+        return self.fn(*deps)
+
+    def _tracked_compute(self):
+        with tracked_reads() as reads:
+            value = self._compute()
+            if isinstance(value, Iterator):
+                value = tuple(value)
+        return reads, value
+
+    def get(self) -> Any:
+        """
+        Computes the value, or returns the one memoized earlier.
+        """
+        if self.cache:
+            hit, value = lookup_memo(self)
+            if not hit:
+                reads, value = self._tracked_compute()
+                store_memo(self, reads, value)
+            return value
+
+        render = current_pass() if self.memoize else None
+        if render is None:
+            return self._compute()
+        cache = render.memo
+        entry = cache.get(id(self))
+        if entry is not None and entry[0] is self and reads_current(entry[1]):
+            replay_reads(entry[1])
+            return entry[2]
+        reads, value = self._tracked_compute()
+        cache[id(self)] = (self, reads, value)
+        return value
+
+    def __repr__(self):
+        name = getattr(self.fn, "__name__", repr(self.fn))
+        return f"<Lazy {name}({', '.join(map(repr, self.deps))})>"
@@ -1,8 +1,79 @@
-import inspect
-from typing import Callable, Optional
+import copy
+import operator
+from contextlib import contextmanager
+from types import (
+    BuiltinFunctionType,
+    CodeType,
+    FunctionType,
+    MethodType,
+    ModuleType,
+)
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
 
 import streamlit as st
 
+from .capabilities import get_capabilities
+from .cold import ColdStorage, set_cold_storage
+from .conditions import Comparison, Cond, Condition
+from .context import (
+    DERIVED_KEY,
+    FORMATTED_KEY,
+    MEMO_KEY,
+    MISSING,
+    OVERRIDES_KEY,
+    PERSIST_KEY,
+    VALUES_KEY,
+    VERSIONS_KEY,
+    WIDGET_VERSIONS_KEY,
+    MemoTable,
+    collect_writes,
+    current_pass,
+    current_version,
+    fingerprint,
+    formatted_values,
+    next_version,
+    pending_writes,
+    record_read,
+    session_overrides,
+    unchanged,
+    written_version,
+)
+from .durable import (
+    PersistenceBackend,
+    forget_persisted,
+    save_persisted,
+    set_persistence,
+)
+from .eviction import MemoryBudget, drop_page, set_memory_budget, touch
+from .lazy import Lazy
+from .query import QueryState, set_query_state
+from .remote import PlaceholderStore, clear_remote, set_store
+from .snapshot import PlaceholderSnapshot, restore_snapshot, take_snapshot
+from .storage import (
+    GLOBAL_NAMESPACE,
+    PROCESS_NAMESPACE,
+    PROCESS_STORE,
+    scoped_key,
+    session_store,
+)
+
+_SCOPES = ("page", "global", "process")
+
+# Objects a format_fn may read that are matched by identity, and containers
+# matched by their content.
+_STABLE_TYPES = (ModuleType, type, BuiltinFunctionType)
+_CONTAINER_TYPES = (list, tuple, set, frozenset, dict)
+
+# Session stores saved and restored around a verified render; the caches are
+# included so both renders reuse the same derived and formatted values.
+_EXPORTED_STORES = (
+    VALUES_KEY,
+    VERSIONS_KEY,
+    WIDGET_VERSIONS_KEY,
+    DERIVED_KEY,
+    FORMATTED_KEY,
+)
+
 
 class PlaceholderValue:
     def __init__(
@@ -12,6 +83,9 @@ class PlaceholderValue:
         name=None,
         global_scope=False,
         format_fn: Optional[Callable] = None,
+        ttl: Optional[float] = None,
+        evictable: bool = True,
+        scope: Optional[str] = None,
     ):
         """Initialize the placeholder.
         A placeholder represents a widget configuration item, offering basic settings for configuration like default, inversion and persistence.
@@ -21,6 +95,9 @@ class PlaceholderValue:
             name (str, optional): Custom name for the configuration item. Will be auto-generated if not specified. Defaults to None.
             global_scope (bool): Whether the placeholder is accessible globally across all pages. Defaults to False.
             format_fn (Callable, optional): Function to format the value. Defaults to None.
+            ttl (float, optional): Seconds after its last use after which the value is evicted, when a MemoryBudget is set. Defaults to None.
+            evictable (bool): Whether a MemoryBudget may evict the value. Defaults to True.
+            scope (str, optional): "page", "global" (same as global_scope=True) or "process" for a value published once and shared by every session; see publish. Defaults to None, deduced from global_scope.
         """
         self._name = name
         self._setup(
@@ -28,8 +105,11 @@ class PlaceholderValue:
             persist=persist,
             global_scope=global_scope,
             format_fn=format_fn,
+            ttl=ttl,
+            evictable=evictable,
+            scope=scope,
         )
-        self._override_key = None
+        self._keys = {}
 
     def __call__(
         self,
@@ -37,14 +117,27 @@ class PlaceholderValue:
         persist=False,
         global_scope=False,
         format_fn: Optional[Callable] = None,
+        ttl: Optional[float] = None,
+        evictable: bool = True,
+        scope: Optional[str] = None,
     ):
-        self._setup(
+        """
+        Returns a copy of the placeholder with new settings.
+
+        The copy addresses the same stored value; the placeholder itself is
+        shared by every session and is left unchanged.
+        """
+        configured = copy.copy(self)
+        configured._setup(
             default=default,
             persist=persist,
             global_scope=global_scope,
             format_fn=format_fn,
+            ttl=ttl,
+            evictable=evictable,
+            scope=scope,
         )
-        return self
+        return configured
 
     def _setup(
         self,
@@ -52,25 +145,63 @@ class PlaceholderValue:
         persist=False,
         global_scope=False,
         format_fn=None,
+        ttl=None,
+        evictable=True,
+        scope=None,
     ):
+        if scope is None:
+            scope = "global" if global_scope else "page"
+        if scope not in _SCOPES:
+            raise ValueError(
+                f"Unknown scope {scope!r}; expected 'page', 'global' or "
+                f"'process'."
+            )
         self._default = default
         self.persist = persist
-        self.global_scope = global_scope
+        self.scope = scope
+        self.global_scope = scope != "page"
         self.format_fn = format_fn
+        self.ttl = ttl
+        self.evictable = evictable
+
+    def can_evict(self, key: str) -> bool:
+        """
+        Whether a MemoryBudget may evict the value stored under 'key'.
+        Override to keep some values regardless of the budget.
+        """
+        return self.evictable
 
     def get_key(self):
-        if self._override_key:
-            return self._override_key
         if self._name == "_CURRENT_PAGE":
             return self._name
-        if self.global_scope:
-            prefix = "_GLOBAL"
+        render = current_pass()
+        if render is not None:
+            key = render.keys.get(self)
+            if key is None:
+                scoped = self._scoped_key()
+                key = render.keys[self] = render.overrides.get(scoped, scoped)
+            return key
+        scoped = self._scoped_key()
+        overrides = st.session_state.get(OVERRIDES_KEY)
+        if overrides:
+            return overrides.get(scoped, scoped)
+        return scoped
+
+    def _scoped_key(self):
+        if self.scope == "process":
+            namespace = PROCESS_NAMESPACE
+        elif self.global_scope:
+            namespace = GLOBAL_NAMESPACE
         else:
-            prefix = Placeholder._CURRENT_PAGE.get()
-        return f"{prefix}_{self._name}"
+            namespace = Placeholder._CURRENT_PAGE.get()
+        key = self._keys.get(namespace)
+        if key is None:
+            key = self._keys[namespace] = scoped_key(namespace, self._name)
+        return key
 
     def __set_name__(self, owner, name):
         self._name = name
+        self._keys = {}
 
     def __set__(self, obj, value):
         self.set(value)
@@ -81,41 +212,320 @@ class PlaceholderValue:
     def set(self, value, *, key=None):
         if key is None:
             key = self.get_key()
-        session_state = st.session_state.setdefault("_placeholder_values", {})
-        session_state[key] = value
+        render = current_pass()
+        if render is not None:
+            render.resolved.pop(key, None)
+            if key == "_CURRENT_PAGE":
+                render.keys.clear()
+            render.touched[key] = self
+        else:
+            touch(key, self)
+        pending = pending_writes()
+        if pending is not None:
+            pending[key] = value
+            return
+        if render is not None:
+            values, versions = render.values, render.versions
+        else:
+            values = session_store(VALUES_KEY)
+            versions = session_store(VERSIONS_KEY)
+        if _store_value(key, value, values):
+            versions[key] = written_version(key, value)
+
+    def publish(self, value, *, key=None):
+        """
+        Sets the value of a scope="process" placeholder for every session.
+
+        The value is stored once, not per session, and must be treated as
+        read-only: a session calling 'set' gets its own copy-on-write value
+        instead, and keeps it over later publishes.
+        """
+        if self.scope != "process":
+            raise ValueError(
+                f"{self._name} is not a scope='process' placeholder; use "
+                f"set() instead."
+            )
+        if key is None:
+            key = self.get_key()
+        PROCESS_STORE.publish(key, next_version(), value)
+        render = current_pass()
+        if render is not None:
+            render.resolved.pop(key, None)
 
     def set_streamlit_key(self, key):
-        self._override_key = key
+        # Kept per session, by storage key: the placeholder is shared by
+        # every session, and page scripts may rebuild it on every rerun.
+        session_overrides()[self._scoped_key()] = key
+        render = current_pass()
+        if render is not None:
+            render.keys[self] = key
+
+    def version(self, *, key=None) -> int:
+        """
+        Returns the version of the placeholder's value.
+
+        Versions start at 0 and increase with every write, whether through
+        'set' or a widget keyed by the placeholder, so a changed version
+        means a new value.
+        """
+        if key is None:
+            key = self.get_key()
+        return current_version(key)
+
+    def cache_key(self, *, key=None):
+        """
+        Returns a cheap, hashable (key, version) pair identifying the
+        placeholder's current value; see HASH_FUNCS.
+        """
+        if key is None:
+            key = self.get_key()
+        return key, current_version(key)
 
     def get(self, *, key=None):
         if key is None:
             key = self.get_key()
 
+        render = current_pass()
+        if render is None:
+            raw, val = self._resolve(
+                key, st.session_state.get(VALUES_KEY, {}), None
+            )
+            touch(key, self)
+        else:
+            # Resolved at most once per pass; set() drops the entry.
+            entry = render.resolved.get(key)
+            if entry is None or entry[0] is not self:
+                entry = render.resolved[key] = (
+                    self,
+                    *self._resolve(key, render.values, render.persist),
+                )
+                render.touched[key] = self
+            raw, val = entry[1], entry[2]
+        record_read(key, raw)
+        return val
+
+    def _resolve(self, key, values, persist_state):
+        pending = pending_writes()
         if key in st.session_state:
-            val = st.session_state[key]
-        elif key in st.session_state.get("_placeholder_values", {}):
-            val = st.session_state["_placeholder_values"].get(key, None)
+            val = raw = st.session_state[key]
+        elif pending is not None and key in pending:
+            val = raw = pending[key]
+        elif key in values:
+            val = raw = values[key]
         else:
-            val = self._default
+            # Process-wide values are shared until the session sets its own.
+            shared = (
+                PROCESS_STORE.get(key) if self.scope == "process" else None
+            )
+            if shared is not None:
+                val = raw = shared[1]
+            else:
+                val = self._default
+                raw = MISSING
 
         if self.persist:
-            persist_data = st.session_state.setdefault("_persist", {})
-            key_data = persist_data.setdefault(key, {})
-            if "first" not in key_data:
-                key_data["first"] = val
-            elif "last" not in key_data and key_data["first"] != val:
-                key_data["last"] = val
-            elif "last" in key_data:
-                val = key_data["last"]
+            if persist_state is None:
+                persist_state = session_store(PERSIST_KEY)
+            val = self._persisted(key, val, persist_state)
 
         if self.format_fn:
-            val = self.format_fn(val)
+            val = self._format(key, val)
+        return raw, val
+
+    def _persisted(self, key, val, persist_state):
+        # The first value read is remembered by its version and, for
+        # scalars, its fingerprint; the first different value is stored and
+        # then locked. Other values cannot be compared safely (e.g.
+        # DataFrames), so any new version of them counts as different.
+        key_data = persist_state.get(key)
+        if key_data is None:
+            persist_state[key] = {
+                "version": current_version(key),
+                "fingerprint": fingerprint(val),
+            }
+            return val
+        if "value" in key_data:
+            return key_data["value"]
+        version = current_version(key)
+        if version != key_data["version"]:
+            value_print = key_data["fingerprint"]
+            if value_print is None or fingerprint(val) != value_print:
+                key_data["value"] = val
+                save_persisted(key, self._name, val)
+            else:
+                key_data["version"] = version
         return val
 
+    def _format(self, key, val, version=None):
+        # format_fn is assumed to be pure: its output is reused, across
+        # reruns, for as long as the version of the value it was computed
+        # from is unchanged and the function still matches.
+        pending = pending_writes()
+        signature = _format_signature(self.format_fn)
+        if signature is None or (pending is not None and key in pending):
+            # Not cached: the function cannot be matched safely, or the
+            # value has no version of its own yet.
+            return self.format_fn(val)
+        if version is None:
+            version = current_version(key)
+        signature = (version, signature)
+        formatted = formatted_values()
+        entry = formatted.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        result = self.format_fn(val)
+        formatted[key] = (signature, result)
+        return result
+
+    # Comparisons with a value are built explicitly, e.g. PH.MODE.eq("a"):
+    # placeholders keep identity equality and hashing, as they are used as
+    # dict keys and in membership tests.
+    def eq(self, value) -> Condition:
+        return Comparison(self, operator.eq, value)
+
+    def ne(self, value) -> Condition:
+        return Comparison(self, operator.ne, value)
+
+    def lt(self, value) -> Condition:
+        return Comparison(self, operator.lt, value)
+
+    def le(self, value) -> Condition:
+        return Comparison(self, operator.le, value)
+
+    def gt(self, value) -> Condition:
+        return Comparison(self, operator.gt, value)
+
+    def ge(self, value) -> Condition:
+        return Comparison(self, operator.ge, value)
+
+    def __invert__(self) -> Condition:
+        return Cond.not_(self)
+
+    def isin(self, values: Iterable) -> Condition:
+        return Cond.isin(self, values)
+
     def __repr__(self):
         return f"<PlaceholderValue name={self._name}>"
 
 
+# Lets st.cache_data/st.cache_resource hash placeholders passed to cached
+# functions by (key, version) instead of by their value, e.g.
+# st.cache_data(hash_funcs=HASH_FUNCS). Placeholders themselves keep hashing
+# by identity, as they are used as dict keys.
+HASH_FUNCS = {PlaceholderValue: PlaceholderValue.cache_key}
+
+
+def _match_key(value, matching) -> Any:
+    """
+    Returns a stand-in that matches value across reruns, None if it may
+    have changed without being replaced.
+    """
+    key = fingerprint(value)
+    if key is not None:
+        return key
+    if isinstance(value, (FunctionType, MethodType)):
+        return _format_signature(value, matching)
+    if isinstance(value, _STABLE_TYPES):
+        # Matched by identity.
+        return value
+    kind = type(value)
+    if kind in _CONTAINER_TYPES:
+        # Matched by content, e.g. the options an index is looked up in.
+        if kind is dict:
+            value = [item for entry in value.items() for item in entry]
+        keys = tuple(map(fingerprint, value))
+        if not any(key is None for key in keys):
+            if kind in (set, frozenset):
+                keys = frozenset(keys)
+            return kind, keys
+    return None
+
+
+def _format_signature(format_fn: Callable, matching=()) -> Any:
+    """
+    Returns what a format_fn is matched by across reruns, None if it cannot
+    be matched safely.
+
+    A lambda in a page script is a new object on every rerun, so functions
+    are matched by code together with the defaults, closure cells and
+    globals the code can read; each of those must be a scalar, a container
+    of scalars, a function matched the same way, or a module or class.
+    Builtins and other callables without code are matched by identity.
+    """
+    code = getattr(format_fn, "__code__", None)
+    if code is None:
+        return format_fn
+    if code in matching:
+        # A function reading itself, e.g. through recursion.
+        return code
+    matching = (*matching, code)
+    read = [
+        *(format_fn.__defaults__ or ()),
+        *(format_fn.__kwdefaults__ or {}).values(),
+    ]
+    if isinstance(format_fn, MethodType):
+        read.append(format_fn.__self__)
+    try:
+        read.extend(cell.cell_contents for cell in format_fn.__closure__ or ())
+    except ValueError:
+        # An empty cell: the variable is not assigned yet.
+        return None
+    namespace = format_fn.__globals__
+    codes = [code]
+    while codes:
+        current = codes.pop()
+        read.extend(
+            namespace[name] for name in current.co_names if name in namespace
+        )
+        codes.extend(c for c in current.co_consts if isinstance(c, CodeType))
+    keys = tuple(_match_key(value, matching) for value in read)
+    if any(key is None for key in keys):
+        return None
+    return code, keys
+
+
+def _store_value(key, value, values) -> bool:
+    """
+    Stores a placeholder value; returns whether it counts as a new write.
+
+    The stored object itself may have been changed in place (e.g. a history
+    list appended to), so only immutable scalars are skipped by identity.
+    """
+    stored = values.get(key, MISSING)
+    if stored is value and fingerprint(value) is not None:
+        return False
+    if key in st.session_state:
+        # Some widgets return a copy of their state (e.g. multiselect),
+        # rebuilt on every rerun; store the state itself so a single copy is
+        # kept, and only count a write if the value changed.
+        widget_value = st.session_state[key]
+        if unchanged(widget_value, value):
+            value = widget_value
+            if unchanged(stored, value):
+                values[key] = value
+                return False
+    values[key] = value
+    return True
+
+
+def _flush_writes(pending) -> None:
+    render = current_pass()
+    if render is not None:
+        values, versions = render.values, render.versions
+    else:
+        values = session_store(VALUES_KEY)
+        versions = session_store(VERSIONS_KEY)
+    # A batch is one write: every changed key gets the same new version.
+    version = None
+    for key, value in pending.items():
+        if unchanged(values.get(key, MISSING), value):
+            continue
+        if _store_value(key, value, values):
+            if version is None:
+                version = next_version()
+            versions[key] = version
+
+
 class _PlaceholderMeta(type):
     def __new__(mcs, name, bases, attrs):
         new_attrs = {}
@@ -146,13 +556,12 @@ class Placeholder(metaclass=_PlaceholderMeta):
     @classmethod
     def update_param_placeholders(cls, obj, obj_args, obj_kwargs, result_key):
         def _resolve(item):
-            if isinstance(item, PlaceholderValue):
+            if isinstance(item, (PlaceholderValue, Lazy)):
                 return item.get()
             else:
                 return item
 
-        sig = inspect.signature(obj)
-        has_key_param = "key" in sig.parameters
+        has_key_param = get_capabilities(obj).has_key
         new_args = [_resolve(arg) for arg in obj_args]
         new_kwargs = {k: _resolve(v) for k, v in obj_kwargs.items()}
         if has_key_param and result_key:
@@ -165,3 +574,169 @@ class Placeholder(metaclass=_PlaceholderMeta):
     @classmethod
     def set_attr(cls, name, value):
         setattr(cls, name, value)
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """
+        Collects the placeholder writes made inside the block and applies
+        them together when it exits.
+
+        Reads inside the block see the pending values. Nothing is written if
+        the block raises, writes of unchanged values are skipped, and the
+        others share a single new version. Nested batches join the
+        outermost one.
+        """
+        if pending_writes() is not None:
+            yield
+            return
+        with collect_writes() as pending:
+            try:
+                yield
+            except BaseException:
+                # Reads inside the block resolved the discarded values.
+                render = current_pass()
+                if render is not None:
+                    for key in pending:
+                        render.resolved.pop(key, None)
+                raise
+        _flush_writes(pending)
+
+    @classmethod
+    def update_many(
+        cls, values: Mapping[Union[PlaceholderValue, str], Any]
+    ) -> None:
+        """
+        Sets several placeholders in one batch.
+
+        Args:
+            values (Mapping): New values keyed by placeholder, or by the name
+                of a placeholder declared on this class.
+        """
+        with cls.batch():
+            for target, value in values.items():
+                if isinstance(target, str):
+                    target = getattr(cls, target)
+                target.set(value)
+
+    @classmethod
+    def clear_page(cls, page_tag):
+        """
+        Drops everything stored for one page's placeholders: values,
+        versions, persisted, derived and formatted values, and the state of
+        widgets keyed by them.
+
+        Each store drops the page's namespace in one step; only widget
+        state, which Streamlit keeps in st.session_state, is removed key by
+        key. Global placeholders and explicit widget keys are kept.
+        """
+        drop_page(page_tag)
+        forget_persisted(page_tag)
+        clear_remote(page_tag)
+
+    @classmethod
+    def snapshot(cls, page_tag=None) -> PlaceholderSnapshot:
+        """
+        Returns the current values of a page's placeholders, e.g. to save a
+        view and bring it back later with 'restore'.
+
+        Args:
+            page_tag (optional): The page. Defaults to the current page.
+        """
+        if page_tag is None:
+            page_tag = cls._CURRENT_PAGE.get()
+        return take_snapshot(page_tag)
+
+    @classmethod
+    def restore(cls, snapshot: PlaceholderSnapshot) -> None:
+        """
+        Sets a page's placeholders back to the values of a snapshot in one
+        write; only changed values are written. Widget-backed values are
+        restored too, so call it before the page's widgets render, e.g. in
+        a callback.
+        """
+        restore_snapshot(snapshot)
+
+    @classmethod
+    def set_memory_budget(cls, budget: Optional[MemoryBudget]) -> None:
+        """
+        Sets the limits on the placeholder state each session keeps, or
+        removes them with None. See MemoryBudget.
+        """
+        set_memory_budget(budget)
+
+    @classmethod
+    def set_cold_storage(cls, storage: Optional[ColdStorage]) -> None:
+        """
+        Enables moving the state of pages a session navigated away from into
+        cold storage, or disables it with None. See ColdStorage.
+        """
+        set_cold_storage(storage)
+
+    @classmethod
+    def set_persistence(
+        cls,
+        backend: Optional[PersistenceBackend],
+        identity: Optional[Callable[[], str]] = None,
+    ) -> None:
+        """
+        Saves the locked values of persist=True placeholders to a durable
+        backend, e.g. SQLiteBackend, or stops saving them with None.
+
+        Args:
+            backend (PersistenceBackend, optional): Where values are saved.
+            identity (Callable, optional): Returns who the current session's values belong to, e.g. the logged-in user's id. Required with a backend.
+        """
+        set_persistence(backend, identity)
+
+    @classmethod
+    def set_store(
+        cls,
+        store: Optional[PlaceholderStore],
+        identity: Optional[Callable[[], str]] = None,
+    ) -> None:
+        """
+        Keeps placeholder values in a shared PlaceholderStore, e.g. a
+        RedisStore, so any replica can serve a session; None stops.
+
+        Args:
+            store (PlaceholderStore, optional): Where values are kept.
+            identity (Callable, optional): Returns the id the current session's values are stored under, e.g. from a cookie; it must be the same on every replica. Required with a store.
+        """
+        set_store(store, identity)
+
+    @classmethod
+    def set_query_state(cls, state: Optional[QueryState]) -> None:
+        """
+        Keeps the values of the placeholders of a QueryState in the URL's
+        query parameters, or stops with None.
+
+        Args:
+            state (QueryState, optional): The placeholders and size limits.
+        """
+        set_query_state(state)
+
+    @classmethod
+    def _export_state(cls):
+        memo = MemoTable()
+        memo.update(st.session_state.get(MEMO_KEY, {}))
+        return (
+            {key: session_store(key).copy() for key in _EXPORTED_STORES},
+            session_store(PERSIST_KEY).copy(dict),
+            memo,
+            dict(session_overrides()),
+        )
+
+    @classmethod
+    def _import_state(cls, state):
+        stores, persist, memo, overrides = state
+        for key, store in stores.items():
+            st.session_state[key] = store.copy()
+        st.session_state[PERSIST_KEY] = persist.copy(dict)
+        st.session_state[OVERRIDES_KEY] = dict(overrides)
+        restored_memo = MemoTable()
+        restored_memo.update(memo)
+        st.session_state[MEMO_KEY] = restored_memo
+        render = current_pass()
+        if render is not None:
+            render.bind()
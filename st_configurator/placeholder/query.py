@@ -0,0 +1,382 @@
+import base64
+import datetime
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import streamlit as st
+
+from .context import (
+    MISSING,
+    VALUES_KEY,
+    VERSIONS_KEY,
+    accepts_state,
+    bound_stores,
+    current_pass,
+    next_version,
+    read_state,
+    unchanged,
+)
+
+QUERY_KEY = "_placeholder_query"
+
+_FORMAT_VERSION = 1
+
+# Deepest nesting of lists and tuples kept in the URL.
+_MAX_DEPTH = 8
+
+# Type tags of encoded values.
+(
+    _NONE,
+    _FALSE,
+    _TRUE,
+    _INT,
+    _FLOAT,
+    _STR,
+    _OPTION,
+    _LIST,
+    _BYTES,
+    _DATE,
+    _TUPLE,
+) = range(11)
+
+
+class _Unencodable(Exception):
+    pass
+
+
+@dataclass(frozen=True, eq=False)
+class QueryField:
+    """
+    A placeholder kept in the URL.
+
+    Attributes:
+        placeholder (PlaceholderValue): The placeholder.
+        options (Sequence, optional): The values it can take, e.g. the options
+            of the selectbox it backs; these are encoded as their index.
+        widget (bool): Whether the placeholder keys a widget that does not
+            take its value from the placeholder (e.g. a selectbox), so a
+            new session must seed the widget's state. Only values among
+            'options', or of the type of a non-None default if there are no
+            options, are seeded. Defaults to False.
+    """
+
+    placeholder: Any
+    options: Optional[Sequence[Any]] = None
+    widget: bool = False
+
+
+@dataclass(frozen=True)
+class QueryState:
+    """
+    Keeps the values of selected placeholders in a query parameter, so a
+    rerun served by any replica, or a shared link, restores them without
+    the session state they came from.
+
+    Values are encoded compactly (varints, option indexes, base64url).
+    Values that cannot be encoded, or take more than 'max_value_bytes', stay
+    in session state only, as do the largest ones if the parameter would
+    exceed 'max_length' characters.
+
+    Attributes:
+        fields (Sequence): Placeholders or QueryFields, in a fixed order;
+            append new fields so existing links keep working.
+        param (str): Name of the query parameter. Defaults to "s".
+        max_value_bytes (int): Largest encoded value kept in the URL.
+            Defaults to 128.
+        max_length (int): Longest parameter value. Defaults to 1024.
+    """
+
+    fields: Sequence[Union[QueryField, Any]]
+    param: str = "s"
+    max_value_bytes: int = 128
+    max_length: int = 1024
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "fields",
+            tuple(
+                field if isinstance(field, QueryField) else QueryField(field)
+                for field in self.fields
+            ),
+        )
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _encode_value(value: Any, options, out: bytearray, depth: int = 0) -> None:
+    if options is not None:
+        try:
+            index = options.index(value)
+        except (ValueError, TypeError):
+            index = None
+        if index is not None:
+            out.append(_OPTION)
+            _varint(index, out)
+            return
+    if value is None:
+        out.append(_NONE)
+    elif value is True or value is False:
+        out.append(_TRUE if value else _FALSE)
+    elif type(value) is int:
+        out.append(_INT)
+        # Zigzag encoding keeps small negative numbers short.
+        _varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+    elif type(value) is float:
+        out.append(_FLOAT)
+        out += struct.pack("<d", value)
+    elif type(value) is str:
+        encoded = value.encode()
+        out.append(_STR)
+        _varint(len(encoded), out)
+        out += encoded
+    elif type(value) is bytes:
+        out.append(_BYTES)
+        _varint(len(value), out)
+        out += value
+    elif type(value) is datetime.date:
+        out.append(_DATE)
+        _varint(value.toordinal(), out)
+    elif type(value) in (list, tuple) and depth < _MAX_DEPTH:
+        # Slider ranges are tuples, multiselect values lists.
+        out.append(_LIST if type(value) is list else _TUPLE)
+        _varint(len(value), out)
+        for item in value:
+            _encode_value(item, options, out, depth + 1)
+    else:
+        raise _Unencodable(type(value))
+
+
+def _decode_value(
+    data: bytes, pos: int, options, depth: int = 0
+) -> Tuple[Any, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag in (_FALSE, _TRUE):
+        return tag == _TRUE, pos
+    if tag == _INT:
+        value, pos = _read_varint(data, pos)
+        return (value >> 1) ^ -(value & 1), pos
+    if tag == _FLOAT:
+        return struct.unpack_from("<d", data, pos)[0], pos + 8
+    if tag in (_STR, _BYTES):
+        length, pos = _read_varint(data, pos)
+        if pos + length > len(data):
+            raise ValueError("Truncated value.")
+        raw = bytes(data[pos : pos + length])
+        return (raw.decode() if tag == _STR else raw), pos + length
+    if tag == _OPTION and options is not None:
+        index, pos = _read_varint(data, pos)
+        return options[index], pos
+    if tag == _DATE:
+        ordinal, pos = _read_varint(data, pos)
+        return datetime.date.fromordinal(ordinal), pos
+    if tag in (_LIST, _TUPLE) and depth < _MAX_DEPTH:
+        length, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(length):
+            item, pos = _decode_value(data, pos, options, depth + 1)
+            items.append(item)
+        return (items if tag == _LIST else tuple(items)), pos
+    raise ValueError(f"Unexpected type tag {tag}.")
+
+
+def _encodable(value: Any, field: QueryField, limit: int) -> Optional[bytes]:
+    out = bytearray()
+    try:
+        _encode_value(value, _options(field), out)
+    except _Unencodable:
+        return None
+    return bytes(out) if len(out) <= limit else None
+
+
+def _options(field: QueryField):
+    return list(field.options) if field.options is not None else None
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) in (int, float)
+
+
+def _fits(value: Any, field: QueryField) -> bool:
+    # A decoded value must be one the field can hold: its default, one of
+    # its options (or a sequence of them), or a value of its default's type.
+    default = field.placeholder._default
+    if unchanged(value, default):
+        return True
+    if field.options is not None:
+        return _among_options(value, _options(field))
+    if default is None:
+        return True
+    if _is_number(default):
+        return _is_number(value)
+    if type(default) in (list, tuple):
+        return type(value) in (list, tuple)
+    return type(value) is type(default)
+
+
+def _among_options(value: Any, options: List[Any]) -> bool:
+    try:
+        if type(value) in (list, tuple):
+            return all(item in options for item in value)
+        return value in options
+    except Exception:
+        return False
+
+
+def encode(state: QueryState, values: Dict[int, Any]) -> str:
+    """
+    Encodes field values, by field index, into a query parameter value.
+    Values that cannot be kept in the URL are left out.
+    """
+    encoded: List[Tuple[int, bytes]] = []
+    for index, value in sorted(values.items()):
+        payload = _encodable(value, state.fields[index], state.max_value_bytes)
+        if payload is not None:
+            encoded.append((index, payload))
+
+    while True:
+        out = bytearray((_FORMAT_VERSION,))
+        for index, payload in encoded:
+            _varint(index, out)
+            out += payload
+        text = base64.urlsafe_b64encode(bytes(out)).rstrip(b"=").decode()
+        if len(text) <= state.max_length or not encoded:
+            return text if encoded else ""
+        # The largest value falls back to session state.
+        encoded.remove(max(encoded, key=lambda item: len(item[1])))
+
+
+def decode(state: QueryState, text: str) -> Dict[int, Any]:
+    """
+    Decodes a query parameter value into field values by index; a value
+    that does not decode yields no values, and values a field cannot hold
+    are left out.
+    """
+    if not text:
+        return {}
+    try:
+        data = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+        if not data or data[0] != _FORMAT_VERSION:
+            return {}
+        values = {}
+        pos = 1
+        while pos < len(data):
+            index, pos = _read_varint(data, pos)
+            field = state.fields[index]
+            value, pos = _decode_value(data, pos, _options(field))
+            if _fits(value, field):
+                values[index] = value
+        return values
+    except Exception:
+        # Links are user input: any malformed value is ignored.
+        return {}
+
+
+_query_state: Optional[QueryState] = None
+
+
+def set_query_state(state: Optional[QueryState]) -> None:
+    global _query_state
+    _query_state = state
+
+
+def _raw_value(field: QueryField) -> Any:
+    placeholder = field.placeholder
+    raw = read_state(placeholder.get_key())[1]
+    return placeholder._default if raw is MISSING else raw
+
+
+def _seeds_widget(field: QueryField, key: str, value: Any) -> bool:
+    if not (field.widget or key in st.session_state):
+        return False
+    if not accepts_state(key):
+        return False
+    if field.options is not None:
+        # Only values the widget itself offers, or it raises on render.
+        return _among_options(value, _options(field))
+    # decode() only yields values of the type of a non-None default.
+    return field.placeholder._default is not None
+
+
+def decode_query() -> None:
+    """
+    Applies the placeholder values found in the query parameter, once per
+    new parameter value. Fields missing from it are reset to their default,
+    unless their current value is one kept in session state only.
+    """
+    state = _query_state
+    if state is None:
+        return
+    text = st.query_params.get(state.param, "")
+    if st.session_state.get(QUERY_KEY) == text:
+        return
+    st.session_state[QUERY_KEY] = text
+    decoded = decode(state, text)
+    values, versions = bound_stores((VALUES_KEY, VERSIONS_KEY))
+    for index, field in enumerate(state.fields):
+        placeholder = field.placeholder
+        key = placeholder.get_key()
+        if index in decoded:
+            value = decoded[index]
+        else:
+            current = _raw_value(field)
+            if _encodable(current, field, state.max_value_bytes) is None:
+                continue
+            value = placeholder._default
+        if unchanged(read_state(key)[1], value):
+            continue
+        values[key] = value
+        versions[key] = next_version()
+        if _seeds_widget(field, key, value):
+            # Widgets keyed by the placeholder show the URL's value.
+            st.session_state[key] = value
+    render = current_pass()
+    if render is not None:
+        render.resolved.clear()
+
+
+def encode_query() -> None:
+    """
+    Writes the current values of the fields to the query parameter, leaving
+    out values equal to their default.
+    """
+    state = _query_state
+    if state is None:
+        return
+    values = {}
+    for index, field in enumerate(state.fields):
+        value = _raw_value(field)
+        if not unchanged(value, field.placeholder._default):
+            values[index] = value
+    text = encode(state, values)
+    if st.session_state.get(QUERY_KEY) == text:
+        return
+    st.session_state[QUERY_KEY] = text
+    if text:
+        st.query_params[state.param] = text
+    elif state.param in st.query_params:
+        del st.query_params[state.param]
@@ -0,0 +1,332 @@
+import abc
+import pickle
+import threading
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import streamlit as st
+
+from .context import (
+    MISSING,
+    VALUES_KEY,
+    VERSIONS_KEY,
+    accepts_state,
+    bound_stores,
+    current_pass,
+    next_version,
+    unchanged,
+)
+from .storage import GLOBAL_NAMESPACE, scoped_key
+
+REMOTE_KEY = "_placeholder_remote"
+
+# Changed values by placeholder name, per namespace.
+Changes = Dict[str, Dict[str, Any]]
+
+
+class PlaceholderStore(abc.ABC):
+    """
+    Shared storage for the placeholder values of sessions, so a session can
+    be served by any replica.
+
+    Values are kept per identity and namespace (a page tag or the global
+    namespace) with a revision that increases with every write, which lets
+    a replica check whether its local copy is current in one call.
+    """
+
+    @abc.abstractmethod
+    def fetch(
+        self, identity: str, revisions: Mapping[str, Optional[int]]
+    ) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        """
+        Returns (revision, values by placeholder name) for each namespace
+        whose revision differs from the given one (None if unknown).
+        """
+
+    @abc.abstractmethod
+    def write(self, identity: str, changes: Changes) -> Dict[str, int]:
+        """
+        Stores changed values per namespace and returns the new revision of
+        each namespace written.
+        """
+
+    @abc.abstractmethod
+    def clear(self, identity: str, namespace: str) -> None:
+        """
+        Deletes every value of an identity in a namespace.
+        """
+
+
+class MemoryStore(PlaceholderStore):
+    """
+    A PlaceholderStore kept in this process, for development and tests.
+    """
+
+    def __init__(self):
+        self._namespaces: Dict[Tuple[str, str], Tuple[int, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def fetch(
+        self, identity: str, revisions: Mapping[str, Optional[int]]
+    ) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        fetched = {}
+        for namespace, known in revisions.items():
+            revision, values = self._namespaces.get(
+                (identity, namespace), (0, {})
+            )
+            if revision != known:
+                fetched[namespace] = revision, dict(values)
+        return fetched
+
+    def write(self, identity: str, changes: Changes) -> Dict[str, int]:
+        revisions = {}
+        with self._lock:
+            for namespace, values in changes.items():
+                revision, stored = self._namespaces.get(
+                    (identity, namespace), (0, {})
+                )
+                self._namespaces[identity, namespace] = (
+                    revision + 1,
+                    {**stored, **values},
+                )
+                revisions[namespace] = revision + 1
+        return revisions
+
+    def clear(self, identity: str, namespace: str) -> None:
+        with self._lock:
+            revision, _ = self._namespaces.get((identity, namespace), (0, {}))
+            self._namespaces[identity, namespace] = revision + 1, {}
+
+
+class RedisStore(PlaceholderStore):
+    """
+    A PlaceholderStore backed by a Redis-protocol server.
+
+    Each namespace is a hash of pickled values plus a revision counter, so a
+    render checks for changes with one pipelined round trip and fetches the
+    changed namespaces with a second one only when another replica wrote to
+    them. Writes are pipelined into a single round trip.
+
+    Args:
+        client: A redis-py compatible client (e.g. redis.Redis), used for
+            'pipeline', 'get', 'hgetall', 'hset', 'delete', 'incr' and
+            'expire'.
+        prefix (str): Prefix of every key written. Defaults to "st_configurator".
+        ttl (int, optional): Seconds after the last write after which a namespace expires. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix: str = "st_configurator",
+        ttl: Optional[int] = None,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _keys(self, identity: str, namespace: str) -> Tuple[str, str]:
+        base = f"{self.prefix}:{identity}:{namespace}"
+        return base, base + ":rev"
+
+    def fetch(
+        self, identity: str, revisions: Mapping[str, Optional[int]]
+    ) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        namespaces = list(revisions)
+        pipe = self.client.pipeline()
+        for namespace in namespaces:
+            pipe.get(self._keys(identity, namespace)[1])
+        current = [int(revision or 0) for revision in pipe.execute()]
+        changed = [
+            (namespace, revision)
+            for namespace, revision in zip(namespaces, current)
+            if revision != revisions[namespace]
+        ]
+        if not changed:
+            return {}
+        pipe = self.client.pipeline()
+        for namespace, _ in changed:
+            pipe.hgetall(self._keys(identity, namespace)[0])
+        fetched = {}
+        for (namespace, revision), fields in zip(changed, pipe.execute()):
+            values = {}
+            for name, blob in fields.items():
+                if isinstance(name, bytes):
+                    name = name.decode()
+                try:
+                    values[name] = pickle.loads(blob)
+                except Exception:
+                    continue
+            fetched[namespace] = revision, values
+        return fetched
+
+    def write(self, identity: str, changes: Changes) -> Dict[str, int]:
+        pipe = self.client.pipeline()
+        commands = 0
+        revision_at = {}
+        for namespace, values in changes.items():
+            key, revision_key = self._keys(identity, namespace)
+            blobs = {}
+            for name, value in values.items():
+                try:
+                    blobs[name] = pickle.dumps(
+                        value, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                except Exception:
+                    # Unpicklable values stay local to this replica.
+                    continue
+            if blobs:
+                pipe.hset(key, mapping=blobs)
+                commands += 1
+            pipe.incr(revision_key)
+            revision_at[namespace] = commands
+            commands += 1
+            if self.ttl is not None:
+                pipe.expire(key, self.ttl)
+                pipe.expire(revision_key, self.ttl)
+                commands += 2
+        results = pipe.execute()
+        return {
+            namespace: int(results[index])
+            for namespace, index in revision_at.items()
+        }
+
+    def clear(self, identity: str, namespace: str) -> None:
+        key, revision_key = self._keys(identity, namespace)
+        pipe = self.client.pipeline()
+        pipe.delete(key)
+        pipe.incr(revision_key)
+        pipe.execute()
+
+
+class RemoteState:
+    """
+    What a session last exchanged with the PlaceholderStore: the revision of
+    each namespace, and the version of each key when it was synced.
+    """
+
+    __slots__ = ("revisions", "synced")
+
+    def __init__(self):
+        self.revisions: Dict[str, Optional[int]] = {}
+        self.synced: Dict[str, Dict[str, int]] = {}
+
+
+_store: Optional[PlaceholderStore] = None
+_identity: Optional[Callable[[], str]] = None
+
+
+def set_store(
+    store: Optional[PlaceholderStore],
+    identity: Optional[Callable[[], str]] = None,
+) -> None:
+    global _store, _identity
+    if store is not None and identity is None:
+        raise ValueError(
+            "A PlaceholderStore needs an identity: a callable returning the "
+            "id the current session's values are stored under."
+        )
+    _store = store
+    _identity = identity
+
+
+def _remote_state() -> RemoteState:
+    state = st.session_state.get(REMOTE_KEY)
+    if state is None:
+        state = st.session_state[REMOTE_KEY] = RemoteState()
+    return state
+
+
+def _name_of(key: str, namespace: str) -> str:
+    # Keys are built by scoped_key as f"{namespace}_{name}".
+    return key[len(namespace) + 1 :]
+
+
+def pull_state(page_tag: Any) -> None:
+    """
+    Brings the session's values of a page and of global placeholders up to
+    date with the store. Values already current locally cost a single
+    revision check; the session stores act as a read-through cache.
+    """
+    store = _store
+    if store is None:
+        return
+    state = _remote_state()
+    namespaces = (str(page_tag), GLOBAL_NAMESPACE)
+    fetched = store.fetch(
+        _identity(),
+        {
+            namespace: state.revisions.get(namespace)
+            for namespace in namespaces
+        },
+    )
+    if not fetched:
+        return
+    values, versions = bound_stores((VALUES_KEY, VERSIONS_KEY))
+    for namespace, (revision, remote) in fetched.items():
+        synced = state.synced.setdefault(namespace, {})
+        for key in list(synced):
+            if _name_of(key, namespace) not in remote:
+                # Deleted by another replica.
+                values.pop(key, None)
+                versions.pop(key, None)
+                del synced[key]
+                if key in st.session_state:
+                    del st.session_state[key]
+        for name, value in remote.items():
+            key = scoped_key(namespace, name)
+            if not unchanged(values.get(key, MISSING), value):
+                values[key] = value
+                versions[key] = next_version()
+                if key in st.session_state and accepts_state(key):
+                    # Widgets keyed by the placeholder show the new value.
+                    st.session_state[key] = value
+            synced[key] = versions.get(key, 0)
+        state.revisions[namespace] = revision
+    render = current_pass()
+    if render is not None:
+        render.resolved.clear()
+
+
+def push_state(page_tag: Any) -> None:
+    """
+    Writes the values of a page and of global placeholders changed since
+    they were last synced to the store, in one call.
+    """
+    store = _store
+    if store is None:
+        return
+    state = _remote_state()
+    values, versions = bound_stores((VALUES_KEY, VERSIONS_KEY))
+    changes: Changes = {}
+    for namespace in (str(page_tag), GLOBAL_NAMESPACE):
+        synced = state.synced.setdefault(namespace, {})
+        changed = {}
+        for key, version in versions.buckets.get(namespace, {}).items():
+            if synced.get(key) != version and key in values:
+                changed[_name_of(key, namespace)] = values[key]
+                synced[key] = version
+        if changed:
+            changes[namespace] = changed
+    if not changes:
+        return
+    revisions = store.write(_identity(), changes)
+    for namespace, revision in revisions.items():
+        known = state.revisions.get(namespace)
+        # Another replica wrote in between: fetch the namespace next time.
+        state.revisions[namespace] = (
+            revision if known is not None and revision == known + 1 else None
+        )
+
+
+def clear_remote(page_tag: Any) -> None:
+    """
+    Deletes a page's values from the store.
+    """
+    store = _store
+    if store is None:
+        return
+    namespace = str(page_tag)
+    store.clear(_identity(), namespace)
+    state = _remote_state()
+    state.synced.pop(namespace, None)
+    state.revisions.pop(namespace, None)
@@ -0,0 +1,107 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+import streamlit as st
+
+from .cold import thaw_page
+from .context import (
+    MISSING,
+    PERSIST_KEY,
+    VALUES_KEY,
+    VERSIONS_KEY,
+    accepts_state,
+    bound_stores,
+    current_pass,
+    next_version,
+    session_overrides,
+    unchanged,
+)
+from .eviction import drop_keys
+from .storage import NamespacedStore, namespace_of
+
+
+class PlaceholderSnapshot(Mapping):
+    """
+    The raw values of a page's placeholders, and of placeholders keyed by
+    an explicit widget key, by storage key, as taken by Placeholder.snapshot.
+
+    The values are shared with the session stores, not copied, so taking a
+    snapshot is cheap and restoring it finds unchanged values by identity;
+    they must not be mutated in place.
+    """
+
+    __slots__ = ("page_tag", "_values")
+
+    def __init__(self, page_tag: Any, values: Dict[str, Any]):
+        self.page_tag = page_tag
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"PlaceholderSnapshot({self.page_tag!r}, {self._values!r})"
+
+
+def _locked(persist: NamespacedStore, key: str) -> bool:
+    key_data = persist.get(key)
+    return key_data is not None and "value" in key_data
+
+
+def take_snapshot(page_tag: Any) -> PlaceholderSnapshot:
+    thaw_page(page_tag)
+    (values,) = bound_stores((VALUES_KEY,))
+    taken = dict(values.buckets.get(page_tag, {}))
+    for scoped, key in session_overrides().items():
+        if namespace_of(scoped) == page_tag and key in values:
+            taken[key] = values[key]
+    state = st.session_state
+    # Widget state is newer than the stored value until the widget renders.
+    taken.update({key: state[key] for key in taken if key in state})
+    return PlaceholderSnapshot(page_tag, taken)
+
+
+def restore_snapshot(snapshot: PlaceholderSnapshot) -> None:
+    """
+    Makes a page's placeholder values those of a snapshot, as one write:
+    changed values share a single new version, widget state is updated for
+    widget-backed keys, and values set since the snapshot was taken are
+    dropped. Locked values of persist=True placeholders are left as they
+    are, as they would be by set().
+    """
+    page_tag = snapshot.page_tag
+    thaw_page(page_tag)
+    values, versions, persist = bound_stores(
+        (VALUES_KEY, VERSIONS_KEY, PERSIST_KEY)
+    )
+    state = st.session_state
+    dropped = [
+        key
+        for key in values.buckets.get(page_tag, {})
+        if key not in snapshot and not _locked(persist, key)
+    ]
+    drop_keys(dropped)
+    version = None
+    for key, value in snapshot.items():
+        current = state[key] if key in state else values.get(key, MISSING)
+        if (
+            current is value
+            or unchanged(current, value)
+            or _locked(persist, key)
+        ):
+            continue
+        if version is None:
+            version = next_version()
+        values[key] = value
+        versions[key] = version
+        if key in state and accepts_state(key):
+            state[key] = value
+    render = current_pass()
+    if render is not None and version is not None:
+        render.resolved.clear()
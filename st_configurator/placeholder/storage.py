@@ -0,0 +1,160 @@
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import streamlit as st
+
+GLOBAL_NAMESPACE = "_GLOBAL"
+# Session overrides of placeholders shared by the whole process.
+PROCESS_NAMESPACE = "_PROCESS"
+# Namespace of keys not built by scoped_key, e.g. explicit widget keys.
+SHARED_NAMESPACE = ""
+# Namespaces that do not belong to a page.
+RESERVED_NAMESPACES = (GLOBAL_NAMESPACE, PROCESS_NAMESPACE, SHARED_NAMESPACE)
+
+_keys: Dict[Tuple[Any, str], str] = {}
+_namespaces: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def scoped_key(namespace: Any, name: str) -> str:
+    """
+    Returns the interned storage key of a placeholder in a namespace: a page
+    tag, GLOBAL_NAMESPACE for global placeholders or PROCESS_NAMESPACE for
+    process-wide ones.
+    """
+    key = _keys.get((namespace, name))
+    if key is None:
+        key = sys.intern(f"{namespace}_{name}")
+        with _lock:
+            _namespaces.setdefault(key, namespace)
+            _keys[(namespace, name)] = key
+    return key
+
+
+def namespace_of(key: str) -> Any:
+    return _namespaces.get(key, SHARED_NAMESPACE)
+
+
+class NamespacedStore:
+    """
+    Per-session placeholder data, split into one bucket per namespace.
+
+    Entries are addressed by storage key, as in a flat dict, and kept in the
+    bucket of the key's namespace, so a page is dropped with a single pop.
+    """
+
+    __slots__ = ("buckets",)
+
+    def __init__(self, buckets: Optional[Dict[Any, Dict[str, Any]]] = None):
+        self.buckets: Dict[Any, Dict[str, Any]] = (
+            buckets if buckets is not None else {}
+        )
+
+    def _bucket(self, key: str) -> Dict[str, Any]:
+        namespace = namespace_of(key)
+        bucket = self.buckets.get(namespace)
+        if bucket is None:
+            bucket = self.buckets[namespace] = {}
+        return bucket
+
+    def __contains__(self, key: str) -> bool:
+        bucket = self.buckets.get(namespace_of(key))
+        return bucket is not None and key in bucket
+
+    def __getitem__(self, key: str) -> Any:
+        return self.buckets[namespace_of(key)][key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._bucket(key)[key] = value
+
+    def __len__(self) -> int:
+        return sum(map(len, self.buckets.values()))
+
+    def __iter__(self) -> Iterator[str]:
+        for bucket in list(self.buckets.values()):
+            yield from list(bucket)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        bucket = self.buckets.get(namespace_of(key))
+        if bucket is None:
+            return default
+        return bucket.get(key, default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        return self._bucket(key).setdefault(key, default)
+
+    def pop(self, key: str, *default) -> Any:
+        bucket = self.buckets.get(namespace_of(key))
+        if bucket is None or key not in bucket:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return bucket.pop(key)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for bucket in list(self.buckets.values()):
+            yield from list(bucket.items())
+
+    def drop_namespace(self, namespace: Any) -> Dict[str, Any]:
+        """
+        Removes a namespace, returning its entries.
+        """
+        return self.buckets.pop(namespace, {})
+
+    def copy(
+        self, copy_value: Optional[Callable[[Any], Any]] = None
+    ) -> "NamespacedStore":
+        return NamespacedStore(
+            {
+                namespace: (
+                    dict(bucket)
+                    if copy_value is None
+                    else {
+                        key: copy_value(value) for key, value in bucket.items()
+                    }
+                )
+                for namespace, bucket in self.buckets.items()
+            }
+        )
+
+
+class ProcessStore:
+    """
+    Placeholder values shared by every session of the process, as
+    (version, value) pairs by storage key.
+
+    Reads are plain dict lookups and take no lock; writes replace whole
+    entries under a lock, so a reader sees either the old or the new pair.
+    """
+
+    __slots__ = ("_entries", "_lock")
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[int, Any]]:
+        return self._entries.get(key)
+
+    def publish(self, key: str, version: int, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, value)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+PROCESS_STORE = ProcessStore()
+
+
+def session_store(name: str) -> NamespacedStore:
+    """
+    Returns the NamespacedStore kept in st.session_state under 'name',
+    creating it on first use.
+    """
+    store = st.session_state.get(name)
+    if store is None:
+        store = st.session_state[name] = NamespacedStore()
+    return store
@@ -0,0 +1,197 @@
+import base64
+import datetime
+
+import pytest
+
+from st_configurator.placeholder import (
+    PlaceholderValue,
+    QueryField,
+    QueryState,
+    query,
+)
+from st_configurator.placeholder.query import decode, encode
+
+REGIONS = ["EU", "US", "APAC"]
+
+STATE = QueryState(
+    [
+        PlaceholderValue(name="YEAR", default=2024),
+        QueryField(PlaceholderValue(name="REGION"), options=REGIONS),
+        PlaceholderValue(name="LABEL", default=""),
+        PlaceholderValue(name="RANGE", default=(0.0, 1.0)),
+        PlaceholderValue(name="DAY"),
+        PlaceholderValue(name="RAW"),
+        QueryField(
+            PlaceholderValue(name="PICKED", default=[]), options=REGIONS
+        ),
+    ]
+)
+
+
+def _text(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _payload(*fields: bytes) -> str:
+    return _text(bytes((query._FORMAT_VERSION,)) + b"".join(fields))
+
+
+def test_round_trip():
+    values = {
+        0: 1999,
+        1: "APAC",
+        2: "héllo wörld",
+        3: (0.25, 0.75),
+        4: datetime.date(2024, 2, 29),
+        5: b"\x00\xff",
+        6: ["US", "EU"],
+    }
+    text = encode(STATE, values)
+    assert text.isascii() and "=" not in text
+    assert decode(STATE, text) == values
+
+
+def test_none_and_bools_round_trip():
+    state = QueryState([PlaceholderValue(name=name) for name in "ABC"])
+    values = {0: None, 1: True, 2: False}
+    assert decode(state, encode(state, values)) == values
+
+
+def test_empty_values_encode_to_empty_text():
+    assert encode(STATE, {}) == ""
+    assert decode(STATE, "") == {}
+
+
+def test_options_are_encoded_as_their_index():
+    text = encode(STATE, {1: "APAC"})
+    data = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+    assert data == bytes((query._FORMAT_VERSION, 1, query._OPTION, 2))
+
+
+def test_values_outside_options_are_rejected():
+    # Encoded as a plain string, but the field only holds its options.
+    text = encode(STATE, {1: "MARS", 6: ["EU", "MARS"]})
+    assert text
+    assert decode(STATE, text) == {}
+
+
+def test_option_index_out_of_range_is_ignored():
+    assert decode(STATE, _payload(bytes((1, query._OPTION, 9)))) == {}
+
+
+@pytest.mark.parametrize(
+    "number", [0, -1, 1, 63, -64, 64, -65, 2**40, -(2**40), 2**70]
+)
+def test_zigzag_ints_round_trip(number):
+    assert decode(STATE, encode(STATE, {0: number})) == {0: number}
+
+
+@pytest.mark.parametrize("number", [0, -1, 63, -64])
+def test_small_ints_take_one_byte(number):
+    out = bytearray()
+    query._encode_value(number, None, out)
+    assert out == bytes((query._INT, out[1])) and out[1] < 0x80
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "!!!",
+        "a",
+        _text(b"\x00"),
+        _text(bytes((query._FORMAT_VERSION + 1, 0, query._NONE))),
+        _payload(bytes((0, 0xFF))),
+        _payload(bytes((42, query._NONE))),
+        _payload(bytes((2, query._STR, 2, 0xFF, 0xFE))),
+    ],
+    ids=[
+        "not-base64",
+        "bad-padding",
+        "unknown-version",
+        "future-version",
+        "unknown-tag",
+        "unknown-field",
+        "invalid-utf8",
+    ],
+)
+def test_malformed_input_yields_no_values(text):
+    assert decode(STATE, text) == {}
+
+
+def test_truncated_data_yields_no_values():
+    for values in ({2: "truncated"}, {3: (0.5, 1.0)}, {5: b"raw"}):
+        data = base64.urlsafe_b64decode(encode(STATE, values) + "==")
+        for end in range(2, len(data)):
+            assert decode(STATE, _text(data[:end])) == {}, (values, end)
+
+
+def test_truncated_varint_yields_no_values():
+    assert decode(STATE, _payload(bytes((0, query._INT, 0x80)))) == {}
+
+
+def test_overflowing_ordinal_yields_no_values():
+    out = bytearray((4, query._DATE))
+    query._varint(datetime.date.max.toordinal() + 1, out)
+    assert decode(STATE, _payload(bytes(out))) == {}
+    out = bytearray((4, query._DATE))
+    query._varint(2**64, out)
+    assert decode(STATE, _payload(bytes(out))) == {}
+
+
+def test_values_nested_too_deeply_stay_out_of_the_url():
+    value = [1]
+    for _ in range(query._MAX_DEPTH):
+        value = [value]
+    assert encode(STATE, {3: value}) == ""
+
+
+def test_payloads_nested_too_deeply_yield_no_values():
+    nested = bytes((query._LIST, 1)) * (query._MAX_DEPTH + 1)
+    text = _payload(bytes((3,)) + nested + bytes((query._NONE,)))
+    assert decode(STATE, text) == {}
+
+
+def test_values_over_the_byte_limit_stay_out_of_the_url():
+    state = QueryState(STATE.fields, max_value_bytes=8)
+    assert decode(state, encode(state, {0: 7, 2: "x" * 16})) == {0: 7}
+
+
+def test_largest_values_are_dropped_to_fit_the_length_limit():
+    state = QueryState(STATE.fields, max_length=16)
+    text = encode(state, {0: 7, 2: "x" * 32})
+    assert len(text) <= 16
+    assert decode(state, text) == {0: 7}
+
+
+def test_unencodable_values_stay_out_of_the_url():
+    assert decode(STATE, encode(STATE, {0: 7, 5: object()})) == {0: 7}
+
+
+@pytest.mark.parametrize(
+    "index, value",
+    [
+        (0, "2024"),
+        (0, [2024]),
+        (2, 5),
+        (3, "0.5"),
+        (1, 3),
+    ],
+    ids=["int-as-str", "int-as-list", "str-as-int", "range-as-str", "option"],
+)
+def test_values_of_the_wrong_type_are_rejected(index, value):
+    text = encode(STATE, {index: value})
+    assert text
+    assert decode(STATE, text) == {}
+
+
+def test_rejected_values_leave_the_others():
+    text = encode(STATE, {0: "2024", 2: "kept", 3: [0.0, 2.0]})
+    assert decode(STATE, text) == {2: "kept", 3: [0.0, 2.0]}
+
+
+def test_numbers_fit_numeric_fields_of_either_type():
+    assert decode(STATE, encode(STATE, {0: 2024.5})) == {0: 2024.5}
+
+
+def test_fields_without_a_default_hold_any_value():
+    assert decode(STATE, encode(STATE, {4: "text"})) == {4: "text"}
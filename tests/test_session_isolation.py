@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from streamlit import config
+from streamlit.runtime import Runtime
+from streamlit.testing.v1 import AppTest
+
+from st_configurator.placeholder import Placeholder, PlaceholderValue
+
+SESSIONS = 16
+RERUNS = 5
+
+
+class SessionPlaceholder(Placeholder):
+    # Shared by every session, as placeholders declared in an app module are.
+    NAME = PlaceholderValue(default="")
+    FLAG = PlaceholderValue(default=False)
+
+
+def _app(session):
+    import operator
+
+    import streamlit as st
+    from test_session_isolation import SessionPlaceholder
+
+    from st_configurator import ComponentConfig, PageConfig, PageRenderer
+
+    page = PageConfig(
+        page_tag="session",
+        body=[
+            ComponentConfig(
+                component=st.text_input,
+                args=("Name",),
+                kwargs={"key": f"name_{session}"},
+                result_key=SessionPlaceholder.NAME,
+            ),
+            ComponentConfig(
+                component=st.write,
+                args=("name", SessionPlaceholder.NAME),
+            ),
+            ComponentConfig(
+                component=st.write,
+                args=("hidden",),
+                condition=SessionPlaceholder.FLAG(format_fn=operator.not_),
+            ),
+        ],
+    )
+    PageRenderer().render_page(page)
+    st.write(f"key={SessionPlaceholder.NAME.get_key()}")
+
+
+@pytest.fixture
+def concurrent_apptest(monkeypatch):
+    # AppTest installs a mock runtime for the duration of each run and
+    # removes it afterwards; keep the last one so concurrent runs share it.
+    latest = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest[:] = [cls._instance]
+        return latest[0]
+
+    monkeypatch.setattr(Runtime, "instance", classmethod(instance))
+    monkeypatch.setattr(Runtime, "exists", classmethod(lambda cls: True))
+    # Magic parses scripts with the ast module, which is not thread-safe
+    # on every supported Python version.
+    magic = config.get_option("runner.magicEnabled")
+    config.set_option("runner.magicEnabled", False)
+    yield
+    config.set_option("runner.magicEnabled", magic)
+
+
+def _run_session(index, errors):
+    try:
+        at = AppTest.from_function(_app, args=(index,), default_timeout=30)
+        at.run()
+        for rerun in range(RERUNS):
+            name = f"user-{index}-{rerun}"
+            at.text_input[0].set_value(name).run()
+            assert not at.exception, at.exception
+            markdown = [m.value for m in at.markdown]
+            assert markdown == [
+                f"name {name}",
+                "hidden",
+                f"key=name_{index}",
+            ], markdown
+    except BaseException as exc:
+        errors.append((index, exc))
+
+
+def test_concurrent_sessions_are_isolated(concurrent_apptest):
+    errors = []
+    threads = [
+        threading.Thread(target=_run_session, args=(index, errors))
+        for index in range(SESSIONS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    # Copies made by calling a placeholder leave the shared one untouched.
+    assert SessionPlaceholder.FLAG.format_fn is None
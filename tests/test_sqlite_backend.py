@@ -0,0 +1,145 @@
+import sqlite3
+
+import pytest
+
+from st_configurator.placeholder import Placeholder, SQLiteBackend
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "placeholders.db")
+
+
+@pytest.fixture
+def backend(path):
+    backend = SQLiteBackend(path, batch_size=4)
+    yield backend
+    backend.close()
+
+
+def test_saved_values_load_after_flush(backend):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.save("alice", "page", "TAGS", ["a", "b"])
+    backend.flush()
+    assert backend.load("alice", ["page"]) == {
+        ("page", "NAME"): "Alice",
+        ("page", "TAGS"): ["a", "b"],
+    }
+
+
+def test_load_sees_pending_writes(backend):
+    for index in range(10):
+        backend.save("alice", "page", f"V{index}", index)
+    values = backend.load("alice", ["page"])
+    assert values == {("page", f"V{index}"): index for index in range(10)}
+
+
+def test_values_are_kept_per_identity_and_namespace(backend):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.save("bob", "page", "NAME", "Bob")
+    backend.save("alice", "other", "NAME", "Other")
+    backend.save("alice", "global", "THEME", "dark")
+    assert backend.load("bob", ["page", "global"]) == {("page", "NAME"): "Bob"}
+    assert backend.load("alice", ["page", "global"]) == {
+        ("page", "NAME"): "Alice",
+        ("global", "THEME"): "dark",
+    }
+
+
+def test_later_saves_replace_earlier_ones(backend):
+    backend.save("alice", "page", "NAME", "first")
+    backend.save("alice", "page", "NAME", "second")
+    assert backend.load("alice", ["page"]) == {("page", "NAME"): "second"}
+
+
+def test_forget_deletes_one_namespace(backend):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.save("alice", "other", "NAME", "Other")
+    backend.save("bob", "page", "NAME", "Bob")
+    backend.forget("alice", "page")
+    assert backend.load("alice", ["page", "other"]) == {
+        ("other", "NAME"): "Other"
+    }
+    assert backend.load("bob", ["page"]) == {("page", "NAME"): "Bob"}
+
+
+def test_writes_happen_behind_the_caller(backend, path):
+    # Another process holding the write lock stalls the writer thread, not
+    # the thread saving values.
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        backend.save("alice", "page", "NAME", "Alice")
+        assert backend._queue.unfinished_tasks == 1
+        rows = other.execute("SELECT COUNT(*) FROM placeholder_values")
+        assert rows.fetchone() == (0,)
+    finally:
+        other.execute("COMMIT")
+        other.close()
+    backend.flush()
+    assert backend._queue.unfinished_tasks == 0
+    assert backend.load("alice", ["page"]) == {("page", "NAME"): "Alice"}
+
+
+def test_values_survive_a_new_backend(backend, path):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.close()
+    reopened = SQLiteBackend(path)
+    try:
+        assert reopened.load("alice", ["page"]) == {("page", "NAME"): "Alice"}
+    finally:
+        reopened.close()
+
+
+def test_unpicklable_values_are_not_saved(backend):
+    backend.save("alice", "page", "FN", lambda: None)
+    backend.save("alice", "page", "NAME", "Alice")
+    assert backend.load("alice", ["page"]) == {("page", "NAME"): "Alice"}
+
+
+def test_values_that_no_longer_load_are_skipped(backend, path):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.flush()
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute(
+        "INSERT INTO placeholder_values VALUES (?, ?, ?, ?)",
+        ("alice", "page", "BROKEN", b"not a pickle"),
+    )
+    other.close()
+    assert backend.load("alice", ["page"]) == {("page", "NAME"): "Alice"}
+
+
+def test_a_failed_batch_does_not_stop_later_writes(backend, monkeypatch):
+    apply = SQLiteBackend._apply
+    calls = []
+
+    def fail_once(connection, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("disk I/O error")
+        apply(connection, batch)
+
+    monkeypatch.setattr(SQLiteBackend, "_apply", staticmethod(fail_once))
+    backend.save("alice", "page", "LOST", 1)
+    backend.flush()
+    backend.save("alice", "page", "KEPT", 2)
+    assert backend.load("alice", ["page"]) == {("page", "KEPT"): 2}
+
+
+def test_flush_raises_once_the_writer_has_stopped(backend):
+    backend.close()
+    backend.save("alice", "page", "NAME", "Alice")
+    with pytest.raises(RuntimeError, match="writer thread"):
+        backend.flush()
+
+
+def test_close_is_idempotent(backend):
+    backend.save("alice", "page", "NAME", "Alice")
+    backend.close()
+    backend.close()
+    assert backend._queue.unfinished_tasks == 0
+
+
+def test_a_backend_needs_an_identity(backend):
+    with pytest.raises(ValueError, match="identity"):
+        Placeholder.set_persistence(backend)